@@ -1,67 +1,100 @@
 """Configuration management for YouTube DeFi Monitor."""
 
 import os
+import pickle
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import yaml
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
 
+try:
+    # C-accelerated loader (libyaml), several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-class ViralityThreshold(BaseModel):
+
+# The config is parsed and validated exactly once at startup from our own
+# YAML file, so plain frozen dataclasses are enough: no per-field validator
+# dispatch, no pydantic in the import chain, and slots keep the instances
+# small. The few numeric coercions YAML does not guarantee are done by hand
+# in load_config.
+
+
+@dataclass(slots=True, frozen=True)
+class ViralityThreshold:
     """Threshold settings for a channel size category."""
-    max_subs: Optional[int] = None
     ratio: float
+    max_subs: Optional[int] = None
 
 
-class ViralityThresholds(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ViralityThresholds:
     """Adaptive virality thresholds based on channel size."""
     small: ViralityThreshold
     medium: ViralityThreshold
     large: ViralityThreshold
 
 
-class MonitoringConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MonitoringConfig:
     """Monitoring settings."""
     virality_thresholds: ViralityThresholds
     check_interval: str = "0 8 * * *"
     max_video_age_days: int = 7
+    max_concurrent: int = 4
+    # How long stored channel metadata stays fresh before re-fetching.
+    channel_ttl_hours: int = 24
 
 
-class ChannelConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChannelConfig:
     """YouTube channel configuration."""
     id: str
     name: str
 
 
-class LLMConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LLMConfig:
     """LLM API configuration."""
     provider: str = "anthropic"
     api_key: str = ""
     model: str = "claude-sonnet-4-20250514"
+    # Per-role overrides; empty falls back to `model`. Structure analysis
+    # emits small JSON and works fine on a cheaper model.
+    analysis_model: str = ""
+    writer_model: str = ""
+    # Route structure analysis through the provider batch API during
+    # scheduled cycles instead of per-video calls.
+    use_batch_analysis: bool = False
 
 
-class TelegramConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TelegramConfig:
     """Telegram bot configuration."""
     bot_token: str = ""
     chat_id: str = ""
 
 
-class FactCheckSource(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FactCheckSource:
     """Fact-checking source configuration."""
     name: str
-    enabled: bool = True
     base_url: str
+    enabled: bool = True
 
 
-class FactCheckConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FactCheckConfig:
     """Fact-checking configuration."""
-    sources: list[FactCheckSource] = []
+    sources: list[FactCheckSource] = field(default_factory=list)
     web_search_enabled: bool = True
 
 
-class StyleConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StyleConfig:
     """Content style configuration."""
     author_name: str = ""
     tone: str = "разговорный, но экспертный"
@@ -69,21 +102,114 @@ class StyleConfig(BaseModel):
     examples_file: str = "prompts/style_examples.md"
 
 
-class DatabaseConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DatabaseConfig:
     """Database configuration."""
     path: str = "data/monitor.db"
 
 
-class AppConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AppConfig:
     """Main application configuration."""
-    youtube_api_key: str = ""
-    channels: list[ChannelConfig] = []
     monitoring: MonitoringConfig
     llm: LLMConfig
     telegram: TelegramConfig
     factcheck: FactCheckConfig
     style: StyleConfig
     database: DatabaseConfig
+    youtube_api_key: str = ""
+    channels: list[ChannelConfig] = field(default_factory=list)
+
+
+# Matches values that are exactly an env-var reference like "${YOUTUBE_API_KEY}"
+_ENV_RE = re.compile(r"^\$\{([^}]+)\}$")
+
+
+def _substitute_env_vars(raw_config: dict) -> dict:
+    """Replace ``${VAR}`` string values with their environment values.
+
+    Walks the parsed YAML tree iteratively (no recursion frames) and only
+    runs the compiled regex on strings; other scalar types pass through.
+    """
+    environ = os.environ
+
+    def _value(value):
+        if type(value) is str:
+            m = _ENV_RE.match(value)
+            if m:
+                return environ.get(m.group(1), "")
+        return value
+
+    result: dict = {}
+    stack: list[tuple[dict, dict]] = [(raw_config, result)]
+
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            if type(value) is dict:
+                dst[key] = child = {}
+                stack.append((value, child))
+            elif type(value) is list:
+                items = []
+                for item in value:
+                    if type(item) is dict:
+                        child = {}
+                        stack.append((item, child))
+                        items.append(child)
+                    else:
+                        items.append(_value(item))
+                dst[key] = items
+            else:
+                dst[key] = _value(value)
+
+    return result
+
+
+def _build_threshold(raw: dict) -> ViralityThreshold:
+    """Build a threshold with explicit numeric coercion."""
+    max_subs = raw.get("max_subs")
+    return ViralityThreshold(
+        ratio=float(raw["ratio"]),
+        max_subs=int(max_subs) if max_subs is not None else None,
+    )
+
+
+# Sidecar cache with the parsed (pre-substitution) YAML tree, keyed on the
+# YAML file's mtime+size. Warm starts skip the YAML parse; env-var
+# substitution and config assembly still run every start, so rotated
+# credentials are picked up on restart and no resolved secrets ever land
+# on disk.
+_CONFIG_CACHE_PATH = Path("data/.config.cache.pkl")
+
+
+def _load_cached_yaml(config_file: Path) -> Optional[dict]:
+    """Load the cached raw YAML tree if it matches the current config file."""
+    try:
+        stat = config_file.stat()
+        with open(_CONFIG_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+            return cached["raw"]
+    except (OSError, KeyError, pickle.PickleError, AttributeError):
+        pass
+    return None
+
+
+def _store_cached_yaml(config_file: Path, raw_config: dict) -> None:
+    """Atomically write the parsed raw YAML tree next to the database."""
+    try:
+        stat = config_file.stat()
+        _CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CONFIG_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"mtime": stat.st_mtime, "size": stat.st_size, "raw": raw_config},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_path.replace(_CONFIG_CACHE_PATH)
+    except (OSError, pickle.PickleError):
+        pass  # Cache is best-effort; next start re-parses the YAML
 
 
 def load_config(config_path: str = "config.yaml") -> AppConfig:
@@ -93,46 +219,51 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_file, "r", encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f)
+    raw_config = _load_cached_yaml(config_file)
+    if raw_config is None:
+        # Binary mode: the loader decodes UTF-8 itself (in C for
+        # CSafeLoader), skipping the TextIOWrapper decode pass.
+        with open(config_file, "rb") as f:
+            raw_config = yaml.load(f, Loader=_YamlLoader)
+        _store_cached_yaml(config_file, raw_config)
 
-    # Substitute environment variables
-    def substitute_env(value):
-        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            env_var = value[2:-1]
-            return os.getenv(env_var, "")
-        return value
+    # Always resolved fresh so env-var rotation takes effect on restart
+    processed_config = _substitute_env_vars(raw_config)
 
-    def process_dict(d):
-        result = {}
-        for key, value in d.items():
-            if isinstance(value, dict):
-                result[key] = process_dict(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    process_dict(item) if isinstance(item, dict) else substitute_env(item)
-                    for item in value
-                ]
-            else:
-                result[key] = substitute_env(value)
-        return result
-
-    processed_config = process_dict(raw_config)
+    monitoring_raw = processed_config.get("monitoring", {})
+    thresholds_raw = monitoring_raw.get("virality_thresholds", {})
+    factcheck_raw = processed_config.get("factcheck", {})
 
-    # Build AppConfig
-    return AppConfig(
+    config = AppConfig(
         youtube_api_key=processed_config.get("youtube", {}).get("api_key", ""),
         channels=[
             ChannelConfig(**ch) for ch in processed_config.get("channels", [])
         ],
-        monitoring=MonitoringConfig(**processed_config.get("monitoring", {})),
+        monitoring=MonitoringConfig(
+            virality_thresholds=ViralityThresholds(
+                small=_build_threshold(thresholds_raw.get("small", {})),
+                medium=_build_threshold(thresholds_raw.get("medium", {})),
+                large=_build_threshold(thresholds_raw.get("large", {})),
+            ),
+            check_interval=monitoring_raw.get("check_interval", "0 8 * * *"),
+            max_video_age_days=int(monitoring_raw.get("max_video_age_days", 7)),
+            max_concurrent=int(monitoring_raw.get("max_concurrent", 4)),
+            channel_ttl_hours=int(monitoring_raw.get("channel_ttl_hours", 24)),
+        ),
         llm=LLMConfig(**processed_config.get("llm", {})),
         telegram=TelegramConfig(**processed_config.get("telegram", {})),
-        factcheck=FactCheckConfig(**processed_config.get("factcheck", {})),
+        factcheck=FactCheckConfig(
+            sources=[
+                FactCheckSource(**src) for src in factcheck_raw.get("sources", [])
+            ],
+            web_search_enabled=factcheck_raw.get("web_search_enabled", True),
+        ),
         style=StyleConfig(**processed_config.get("style", {})),
         database=DatabaseConfig(**processed_config.get("database", {})),
     )
 
+    return config
+
 
 # Global config instance
 _config: Optional[AppConfig] = None
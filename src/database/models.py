@@ -1,14 +1,26 @@
 """Database models and operations for YouTube DeFi Monitor."""
 
-import json
+import orjson
 import aiosqlite
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=8192)
+def _iso(value: str) -> datetime:
+    """Memoized ISO timestamp parse.
+
+    CURRENT_TIMESTAMP defaults have second resolution, so batches of rows
+    share identical strings and re-reads of the same rows are common.
+    """
+    return datetime.fromisoformat(value)
+
+
 class ScriptStatus(str, Enum):
     """Status of a generated script."""
     DRAFT = "draft"
@@ -25,7 +37,7 @@ class FactStatus(str, Enum):
     UNVERIFIED = "unverified"
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     """YouTube channel model."""
     id: str
@@ -42,7 +54,7 @@ class Channel:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Video:
     """YouTube video model."""
     id: str
@@ -69,7 +81,7 @@ class Video:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedFact:
     """A fact extracted from video and its verification status."""
     id: Optional[int] = None
@@ -92,7 +104,7 @@ class VerifiedFact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Script:
     """Generated script model."""
     id: Optional[int] = None
@@ -113,6 +125,61 @@ class Script:
         }
 
 
+# Row hydration helpers.
+#
+# Rows coming back from our own database are trusted, so we skip the
+# generated dataclass __init__ (default handling, field ordering) and
+# assign attributes directly on a bare instance. On list-heavy reads
+# such as get_viral_videos this is the dominant per-row cost.
+
+def _channel_from_row(row) -> Channel:
+    channel = object.__new__(Channel)
+    channel.id = row["id"]
+    channel.name = row["name"]
+    channel.subscribers = row["subscribers"]
+    channel.last_checked = (
+        _iso(row["last_checked"]) if row["last_checked"] else None
+    )
+    return channel
+
+
+def _video_from_row(row) -> Video:
+    video = object.__new__(Video)
+    video.id = row["id"]
+    video.channel_id = row["channel_id"]
+    video.title = row["title"]
+    video.views = row["views"]
+    video.published_at = _iso(row["published_at"])
+    video.virality_score = row["virality_score"]
+    video.transcript = row["transcript"]
+    video.structure = orjson.loads(row["structure"]) if row["structure"] else None
+    video.created_at = _iso(row["created_at"])
+    return video
+
+
+def _fact_from_row(row) -> VerifiedFact:
+    fact = object.__new__(VerifiedFact)
+    fact.id = row["id"]
+    fact.video_id = row["video_id"]
+    fact.claim = row["claim"]
+    fact.status = FactStatus(row["status"])
+    fact.source = row["source"]
+    fact.verified_value = row["verified_value"]
+    fact.created_at = _iso(row["created_at"])
+    return fact
+
+
+def _script_from_row(row) -> Script:
+    script = object.__new__(Script)
+    script.id = row["id"]
+    script.source_video_id = row["source_video_id"]
+    script.topic = row["topic"]
+    script.script_text = row["script_text"]
+    script.status = ScriptStatus(row["status"])
+    script.created_at = _iso(row["created_at"])
+    return script
+
+
 class Database:
     """Async SQLite database wrapper."""
 
@@ -120,11 +187,13 @@ class Database:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: Optional[aiosqlite.Connection] = None
+        self._tx_depth = 0
 
     async def connect(self) -> None:
         """Connect to the database."""
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
+        await self._apply_pragmas()
         await self._create_tables()
 
     async def close(self) -> None:
@@ -133,6 +202,46 @@ class Database:
             await self._connection.close()
             self._connection = None
 
+    @asynccontextmanager
+    async def transaction(self):
+        """Batch several mutations into one commit.
+
+        Inside ``async with db.transaction():`` the per-call commits in
+        the mutation methods are suppressed and a single commit (or
+        rollback on error) happens on exit. Nesting reuses the outermost
+        transaction. Standalone calls keep committing immediately.
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                await self._connection.rollback()
+            raise
+        else:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                await self._connection.commit()
+
+    async def _maybe_commit(self) -> None:
+        """Commit unless an enclosing transaction() will do it."""
+        if self._tx_depth == 0:
+            await self._connection.commit()
+
+    async def _apply_pragmas(self) -> None:
+        """Tune the connection for our read-mostly workload.
+
+        WAL + synchronous=NORMAL drops the per-commit fsync while staying
+        crash-safe; mmap and a larger page cache make hot reads
+        near-zero-syscall.
+        """
+        await self._connection.execute("PRAGMA journal_mode=WAL")
+        await self._connection.execute("PRAGMA synchronous=NORMAL")
+        await self._connection.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        await self._connection.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        await self._connection.execute("PRAGMA temp_store=MEMORY")
+
     async def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         await self._connection.executescript("""
@@ -179,7 +288,12 @@ class Database:
 
             CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos(channel_id);
             CREATE INDEX IF NOT EXISTS idx_videos_virality ON videos(virality_score DESC);
-            CREATE INDEX IF NOT EXISTS idx_scripts_status ON scripts(status);
+            -- Composite index lets get_pending_scripts stream rows in index
+            -- order instead of sorting matches in a temp B-tree.
+            DROP INDEX IF EXISTS idx_scripts_status;
+            CREATE INDEX IF NOT EXISTS idx_scripts_status_created
+                ON scripts(status, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_scripts_source ON scripts(source_video_id);
             CREATE INDEX IF NOT EXISTS idx_facts_video ON verified_facts(video_id);
         """)
         await self._connection.commit()
@@ -198,7 +312,7 @@ class Database:
             """,
             (channel.id, channel.name, channel.subscribers, channel.last_checked),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
 
     async def get_channel(self, channel_id: str) -> Optional[Channel]:
         """Get a channel by ID."""
@@ -207,31 +321,14 @@ class Database:
         ) as cursor:
             row = await cursor.fetchone()
             if row:
-                return Channel(
-                    id=row["id"],
-                    name=row["name"],
-                    subscribers=row["subscribers"],
-                    last_checked=datetime.fromisoformat(row["last_checked"])
-                    if row["last_checked"]
-                    else None,
-                )
+                return _channel_from_row(row)
         return None
 
     async def get_all_channels(self) -> list[Channel]:
         """Get all channels."""
         async with self._connection.execute("SELECT * FROM channels") as cursor:
             rows = await cursor.fetchall()
-            return [
-                Channel(
-                    id=row["id"],
-                    name=row["name"],
-                    subscribers=row["subscribers"],
-                    last_checked=datetime.fromisoformat(row["last_checked"])
-                    if row["last_checked"]
-                    else None,
-                )
-                for row in rows
-            ]
+            return [_channel_from_row(row) for row in rows]
 
     # Video operations
     async def insert_video(self, video: Video) -> None:
@@ -255,11 +352,43 @@ class Database:
                 video.published_at,
                 video.virality_score,
                 video.transcript,
-                json.dumps(video.structure) if video.structure else None,
+                orjson.dumps(video.structure) if video.structure else None,
                 video.created_at,
             ),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
+
+    async def insert_videos_bulk(self, videos: list[Video]) -> None:
+        """Insert many videos in one statement and one transaction."""
+        if not videos:
+            return
+        await self._connection.executemany(
+            """
+            INSERT INTO videos (id, channel_id, title, views, published_at,
+                               virality_score, transcript, structure, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                views = excluded.views,
+                virality_score = excluded.virality_score,
+                transcript = COALESCE(excluded.transcript, videos.transcript),
+                structure = COALESCE(excluded.structure, videos.structure)
+            """,
+            [
+                (
+                    video.id,
+                    video.channel_id,
+                    video.title,
+                    video.views,
+                    video.published_at,
+                    video.virality_score,
+                    video.transcript,
+                    orjson.dumps(video.structure) if video.structure else None,
+                    video.created_at,
+                )
+                for video in videos
+            ],
+        )
+        await self._maybe_commit()
 
     async def get_video(self, video_id: str) -> Optional[Video]:
         """Get a video by ID."""
@@ -268,59 +397,67 @@ class Database:
         ) as cursor:
             row = await cursor.fetchone()
             if row:
-                return Video(
-                    id=row["id"],
-                    channel_id=row["channel_id"],
-                    title=row["title"],
-                    views=row["views"],
-                    published_at=datetime.fromisoformat(row["published_at"]),
-                    virality_score=row["virality_score"],
-                    transcript=row["transcript"],
-                    structure=json.loads(row["structure"]) if row["structure"] else None,
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
+                return _video_from_row(row)
         return None
 
-    async def get_viral_videos(self, limit: int = 10) -> list[Video]:
-        """Get videos sorted by virality score."""
+    async def iter_viral_videos(self, limit: int = 10):
+        """Stream videos sorted by virality score.
+
+        Yields one hydrated Video at a time so consumers that stop early
+        (e.g. top-N displays) never pay for parsing the tail.
+        """
         async with self._connection.execute(
             "SELECT * FROM videos ORDER BY virality_score DESC LIMIT ?", (limit,)
         ) as cursor:
+            async for row in cursor:
+                yield _video_from_row(row)
+
+    async def get_viral_videos(self, limit: int = 10) -> list[Video]:
+        """Get videos sorted by virality score."""
+        return [video async for video in self.iter_viral_videos(limit)]
+
+    async def get_all_video_ids(self) -> list[str]:
+        """Get the IDs of every stored video (for seen-ID priming)."""
+        async with self._connection.execute("SELECT id FROM videos") as cursor:
             rows = await cursor.fetchall()
-            return [
-                Video(
-                    id=row["id"],
-                    channel_id=row["channel_id"],
-                    title=row["title"],
-                    views=row["views"],
-                    published_at=datetime.fromisoformat(row["published_at"]),
-                    virality_score=row["virality_score"],
-                    transcript=row["transcript"],
-                    structure=json.loads(row["structure"]) if row["structure"] else None,
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            return [row[0] for row in rows]
 
     async def video_exists(self, video_id: str) -> bool:
         """Check if a video already exists."""
         async with self._connection.execute(
-            "SELECT 1 FROM videos WHERE id = ?", (video_id,)
+            "SELECT EXISTS(SELECT 1 FROM videos WHERE id = ?)", (video_id,)
         ) as cursor:
-            return await cursor.fetchone() is not None
+            row = await cursor.fetchone()
+            return bool(row[0])
 
     async def update_video_transcript(
         self, video_id: str, transcript: str, structure: Optional[dict] = None
     ) -> None:
-        """Update video transcript and structure."""
+        """Update video transcript and structure, skipping no-op writes."""
+        structure_blob = orjson.dumps(structure) if structure else None
+
+        # Pipeline re-runs often re-extract the same transcript; comparing
+        # against the stored values first elides the write (and its fsync)
+        # entirely when nothing changed.
+        async with self._connection.execute(
+            "SELECT transcript, structure FROM videos WHERE id = ?", (video_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is not None:
+            current_structure = row["structure"]
+            if isinstance(current_structure, str):
+                current_structure = current_structure.encode()
+            if row["transcript"] == transcript and current_structure == structure_blob:
+                return
+
         await self._connection.execute(
             """
             UPDATE videos SET transcript = ?, structure = ?
             WHERE id = ?
             """,
-            (transcript, json.dumps(structure) if structure else None, video_id),
+            (transcript, structure_blob, video_id),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
 
     # Fact operations
     async def insert_fact(self, fact: VerifiedFact) -> int:
@@ -339,27 +476,43 @@ class Database:
                 fact.created_at,
             ),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
         return cursor.lastrowid
 
+    async def insert_facts_bulk(self, facts: list[VerifiedFact]) -> None:
+        """Insert many facts in one statement and one transaction.
+
+        Unlike insert_fact this does not return rowids; use it when the
+        caller only needs the facts persisted (the pipeline case).
+        """
+        if not facts:
+            return
+        await self._connection.executemany(
+            """
+            INSERT INTO verified_facts (video_id, claim, status, source, verified_value, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    fact.video_id,
+                    fact.claim,
+                    fact.status.value,
+                    fact.source,
+                    fact.verified_value,
+                    fact.created_at,
+                )
+                for fact in facts
+            ],
+        )
+        await self._maybe_commit()
+
     async def get_facts_for_video(self, video_id: str) -> list[VerifiedFact]:
         """Get all facts for a video."""
         async with self._connection.execute(
             "SELECT * FROM verified_facts WHERE video_id = ?", (video_id,)
         ) as cursor:
             rows = await cursor.fetchall()
-            return [
-                VerifiedFact(
-                    id=row["id"],
-                    video_id=row["video_id"],
-                    claim=row["claim"],
-                    status=FactStatus(row["status"]),
-                    source=row["source"],
-                    verified_value=row["verified_value"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            return [_fact_from_row(row) for row in rows]
 
     async def get_verified_facts_for_video(self, video_id: str) -> list[VerifiedFact]:
         """Get only verified facts for a video."""
@@ -368,18 +521,7 @@ class Database:
             (video_id,),
         ) as cursor:
             rows = await cursor.fetchall()
-            return [
-                VerifiedFact(
-                    id=row["id"],
-                    video_id=row["video_id"],
-                    claim=row["claim"],
-                    status=FactStatus(row["status"]),
-                    source=row["source"],
-                    verified_value=row["verified_value"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            return [_fact_from_row(row) for row in rows]
 
     # Script operations
     async def insert_script(self, script: Script) -> int:
@@ -397,7 +539,7 @@ class Database:
                 script.created_at,
             ),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
         return cursor.lastrowid
 
     async def get_script(self, script_id: int) -> Optional[Script]:
@@ -407,14 +549,7 @@ class Database:
         ) as cursor:
             row = await cursor.fetchone()
             if row:
-                return Script(
-                    id=row["id"],
-                    source_video_id=row["source_video_id"],
-                    topic=row["topic"],
-                    script_text=row["script_text"],
-                    status=ScriptStatus(row["status"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
+                return _script_from_row(row)
         return None
 
     async def get_pending_scripts(self) -> list[Script]:
@@ -423,17 +558,7 @@ class Database:
             "SELECT * FROM scripts WHERE status = 'draft' ORDER BY created_at DESC"
         ) as cursor:
             rows = await cursor.fetchall()
-            return [
-                Script(
-                    id=row["id"],
-                    source_video_id=row["source_video_id"],
-                    topic=row["topic"],
-                    script_text=row["script_text"],
-                    status=ScriptStatus(row["status"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            return [_script_from_row(row) for row in rows]
 
     async def update_script_status(self, script_id: int, status: ScriptStatus) -> None:
         """Update script status."""
@@ -441,11 +566,13 @@ class Database:
             "UPDATE scripts SET status = ? WHERE id = ?",
             (status.value, script_id),
         )
-        await self._connection.commit()
+        await self._maybe_commit()
 
     async def script_exists_for_video(self, video_id: str) -> bool:
         """Check if a script already exists for a video."""
         async with self._connection.execute(
-            "SELECT 1 FROM scripts WHERE source_video_id = ?", (video_id,)
+            "SELECT EXISTS(SELECT 1 FROM scripts WHERE source_video_id = ?)",
+            (video_id,),
         ) as cursor:
-            return await cursor.fetchone() is not None
+            row = await cursor.fetchone()
+            return bool(row[0])
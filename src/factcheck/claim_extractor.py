@@ -1,20 +1,54 @@
 """Extract verifiable claims from video transcripts using LLM."""
 
-import json
+import re
+import orjson
 import structlog
 from dataclasses import dataclass
-from typing import Optional
-
-import anthropic
-import openai
 
 from ..config import get_config
+from ..llm import get_llm_client
 
 
 logger = structlog.get_logger()
 
 
-@dataclass
+def _truncate_text(text: str, max_chars: int = 15000) -> str:
+    """Truncate long text on a sentence/word boundary instead of mid-word.
+
+    Cutting mid-word wastes prompt tokens on a broken fragment the model
+    has to re-tokenize; the last sentence end (or word break) below the
+    cap keeps the input clean at the same budget.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    cut = text.rfind(". ", 0, max_chars)
+    if cut > max_chars // 2:
+        return text[:cut + 1]
+
+    cut = text.rfind(" ", 0, max_chars)
+    if cut > max_chars // 2:
+        return text[:cut]
+
+    return text[:max_chars] + "..."
+
+
+# Extracts the payload of a markdown code fence in one pass
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# One compiled alternation instead of five substring passes per claim;
+# the matched group name is the category.
+_CATEGORY_RE = re.compile(
+    r"(?P<price>цена|price|\$|usd|стоит)"
+    r"|(?P<tvl>tvl|ликвидност|liquidity|locked)"
+    r"|(?P<percentage>%|процент|apy|apr|доходност)"
+    r"|(?P<date>запуск|launch|дата|год|месяц)"
+    r"|(?P<protocol_info>протокол|protocol|сеть|chain)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
 class ExtractedClaim:
     """A claim extracted from text that can be verified."""
     claim: str
@@ -53,6 +87,10 @@ CLAIM_EXTRACTION_PROMPT = """Ты эксперт по DeFi и криптовал
 
 Ответ в формате JSON:"""
 
+# Pre-split around the single {text} placeholder so per-call assembly is
+# plain concatenation instead of re-parsing the format template.
+_PROMPT_PREFIX, _PROMPT_SUFFIX = CLAIM_EXTRACTION_PROMPT.split("{text}")
+
 
 class ClaimExtractor:
     """Extract verifiable claims from text using LLM."""
@@ -63,10 +101,7 @@ class ClaimExtractor:
         self.model = config.llm.model
         self.api_key = config.llm.api_key
 
-        if self.provider == "anthropic":
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-        else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = get_llm_client(self.provider, self.api_key)
 
     async def extract_claims(
         self,
@@ -85,22 +120,21 @@ class ClaimExtractor:
         if not text or len(text) < 50:
             return []
 
-        # Truncate very long texts
-        if len(text) > 15000:
-            text = text[:15000] + "..."
+        # Truncate very long texts on a sentence boundary
+        text = _truncate_text(text)
 
         try:
-            prompt = CLAIM_EXTRACTION_PROMPT.format(text=text)
+            prompt = f"{_PROMPT_PREFIX}{text}{_PROMPT_SUFFIX}"
 
             if self.provider == "anthropic":
-                response = self.client.messages.create(
+                response = await self.client.messages.create(
                     model=self.model,
                     max_tokens=4096,
                     messages=[{"role": "user", "content": prompt}],
                 )
                 response_text = response.content[0].text
             else:
-                response = self.client.chat.completions.create(
+                response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=4096,
@@ -116,7 +150,12 @@ class ClaimExtractor:
                     claim = ExtractedClaim(
                         claim=item.get("claim", ""),
                         category=item.get("category", "other"),
-                        entities=item.get("entities", []),
+                        # Canonical lowercase form; downstream source
+                        # lookups key on entities as-is.
+                        entities=[
+                            str(e).strip().lower()
+                            for e in item.get("entities", [])
+                        ],
                         original_text=item.get("original_text", ""),
                         confidence=float(item.get("confidence", 0.5)),
                     )
@@ -149,14 +188,9 @@ class ClaimExtractor:
         text = text.strip()
 
         # Handle markdown code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
+        fence = _FENCE_RE.search(text)
+        if fence:
+            text = fence.group(1)
 
         # Find array boundaries
         if "[" in text:
@@ -165,11 +199,11 @@ class ClaimExtractor:
             text = text[start:end]
 
         try:
-            data = json.loads(text)
+            data = orjson.loads(text)
             if isinstance(data, list):
                 return data
             return []
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning("json_parse_error", error=str(e), text=text[:200])
             return []
 
@@ -182,17 +216,5 @@ class ClaimExtractor:
         Returns:
             Category string.
         """
-        claim_lower = claim.lower()
-
-        if any(w in claim_lower for w in ["цена", "price", "$", "usd", "стоит"]):
-            return "price"
-        if any(w in claim_lower for w in ["tvl", "ликвидност", "liquidity", "locked"]):
-            return "tvl"
-        if any(w in claim_lower for w in ["%", "процент", "apy", "apr", "доходност"]):
-            return "percentage"
-        if any(w in claim_lower for w in ["запуск", "launch", "дата", "год", "месяц"]):
-            return "date"
-        if any(w in claim_lower for w in ["протокол", "protocol", "сеть", "chain"]):
-            return "protocol_info"
-
-        return "other"
+        match = _CATEGORY_RE.search(claim)
+        return match.lastgroup if match else "other"
@@ -1,6 +1,11 @@
 """Data sources for fact verification (DefiLlama, CoinGecko)."""
 
+import asyncio
+import functools
+import time
+
 import httpx
+import orjson
 import structlog
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -11,20 +16,67 @@ from datetime import datetime
 logger = structlog.get_logger()
 
 
-@dataclass
+def _ttl_cache(ttl: float):
+    """TTL cache for async source methods, with in-flight coalescing.
+
+    Repeated claims in a transcript (and across a batch) hit the same
+    protocol/token endpoints; a cache hit skips the network round-trip
+    entirely. Concurrent identical calls share one HTTP request through a
+    pending Future instead of racing duplicates to the API.
+    """
+    def decorator(fn):
+        cache: dict[tuple, tuple[float, Any]] = {}
+        pending: dict[tuple, asyncio.Future] = {}
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args):
+            key = tuple(a.lower() if type(a) is str else a for a in args)
+
+            hit = cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+
+            fut = pending.get(key)
+            if fut is not None:
+                return await fut
+
+            fut = asyncio.get_running_loop().create_future()
+            pending[key] = fut
+            try:
+                value = await fn(self, *args)
+            except BaseException as e:
+                # Includes CancelledError: callers racing tasks may cancel
+                # the loser, and waiters coalesced onto its future must
+                # still be released rather than hang.
+                fut.set_exception(e)
+                fut.exception()  # mark retrieved for futures nobody awaits
+                raise
+            else:
+                cache[key] = (time.monotonic(), value)
+                fut.set_result(value)
+                return value
+            finally:
+                pending.pop(key, None)
+
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True)
 class FactData:
-    """Data retrieved from a source for fact verification."""
+    """Data retrieved from a source for fact verification.
+
+    ``timestamp`` is left unset unless a caller cares when the data was
+    fetched; stamping every instance in __post_init__ cost a datetime
+    construction per object and nothing ever read it.
+    """
     source: str
     query: str
     value: Any
     unit: Optional[str] = None
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None
     raw_data: Optional[dict] = None
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
-
 
 class DataSource(ABC):
     """Abstract base class for data sources."""
@@ -53,55 +105,71 @@ class DefiLlamaSource(DataSource):
 
     BASE_URL = "https://api.llama.fi"
 
+    def __init__(self):
+        # One long-lived client per source: keep-alive connections skip the
+        # TCP+TLS handshake that dominated per-request latency when every
+        # call opened its own AsyncClient.
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            # Both APIs speak h2; multiplexing lets the gather fan-out
+            # share one TCP+TLS connection instead of queueing on the pool
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
+
     @property
     def name(self) -> str:
         return "defillama"
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
     async def query(self, query: str) -> Optional[FactData]:
         """Query DefiLlama for protocol/TVL data."""
-        # Try different query types
-        result = await self.get_protocol_tvl(query)
-        if result:
-            return result
-
-        result = await self.get_chain_tvl(query)
-        if result:
-            return result
-
-        return None
-
-    async def get_protocol_tvl(self, protocol: str) -> Optional[FactData]:
+        # Protocol first, chain only on a miss. Racing both endpoints
+        # issued the chain request even when the protocol lookup hit;
+        # the sequential probe keeps the hit path at one request, and
+        # the chain fallback is usually free anyway (it reads the
+        # TTL-cached /v2/chains index).
+        data = await self.get_protocol_tvl(query)
+        if data is not None:
+            return data
+        return await self.get_chain_tvl(query)
+
+    @_ttl_cache(300)
+    async def get_protocol_tvl(
+        self, protocol: str, include_metadata: bool = False
+    ) -> Optional[FactData]:
         """Get TVL for a specific protocol.
 
         Args:
             protocol: Protocol name (e.g., "aave", "uniswap").
+            include_metadata: Fetch the full protocol payload (name,
+                symbol, chain) instead of just the current TVL scalar.
 
         Returns:
             FactData with TVL info.
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                # Get protocol data
-                response = await client.get(
-                    f"{self.BASE_URL}/protocol/{protocol.lower()}",
-                    timeout=10.0,
-                )
+        # Assumes the caller lowercased (entities are normalized at
+        # claim extraction); the cache key relies on the same form.
+        q = protocol
+
+        if not include_metadata:
+            # /tvl/{protocol} answers with a single number; the full
+            # /protocol payload carries the entire historical timeseries
+            # only to have its last entry read.
+            try:
+                response = await self._client.get(f"/tvl/{q}")
 
                 if response.status_code != 200:
                     return None
 
-                data = response.json()
-
-                tvl = data.get("tvl")
-                if tvl is None:
+                current_tvl = orjson.loads(response.content)
+                if not isinstance(current_tvl, (int, float)):
                     return None
 
-                # Get current TVL (last entry)
-                if isinstance(tvl, list) and tvl:
-                    current_tvl = tvl[-1].get("totalLiquidityUSD", 0)
-                else:
-                    current_tvl = tvl
-
                 logger.info(
                     "defillama_tvl_fetched",
                     protocol=protocol,
@@ -113,18 +181,74 @@ class DefiLlamaSource(DataSource):
                     query=protocol,
                     value=current_tvl,
                     unit="USD",
-                    raw_data={
-                        "name": data.get("name"),
-                        "symbol": data.get("symbol"),
-                        "chain": data.get("chain"),
-                        "tvl": current_tvl,
-                    },
                 )
 
+            except Exception as e:
+                logger.error("defillama_error", protocol=protocol, error=str(e))
+                return None
+
+        try:
+            response = await self._client.get(f"/protocol/{q}")
+
+            if response.status_code != 200:
+                return None
+
+            data = orjson.loads(response.content)
+
+            tvl = data.get("tvl")
+            if tvl is None:
+                return None
+
+            # Get current TVL (last entry)
+            if isinstance(tvl, list) and tvl:
+                current_tvl = tvl[-1].get("totalLiquidityUSD", 0)
+            else:
+                current_tvl = tvl
+
+            logger.info(
+                "defillama_tvl_fetched",
+                protocol=protocol,
+                tvl=current_tvl,
+            )
+
+            return FactData(
+                source=self.name,
+                query=protocol,
+                value=current_tvl,
+                unit="USD",
+                raw_data={
+                    "name": data.get("name"),
+                    "symbol": data.get("symbol"),
+                    "chain": data.get("chain"),
+                    "tvl": current_tvl,
+                },
+            )
+
         except Exception as e:
             logger.error("defillama_error", protocol=protocol, error=str(e))
             return None
 
+    @_ttl_cache(300)
+    async def _fetch_chains_index(self) -> dict[str, dict]:
+        """Fetch /v2/chains once per TTL window, indexed by lowercase name.
+
+        Every chain-TVL lookup previously re-downloaded the list and
+        lowercased each element while probing; the shared index makes a
+        lookup one dict hit.
+        """
+        try:
+            response = await self._client.get("/v2/chains")
+
+            if response.status_code != 200:
+                return {}
+
+            chains = orjson.loads(response.content)
+            return {c.get("name", "").lower(): c for c in chains}
+
+        except Exception as e:
+            logger.error("defillama_chains_fetch_error", error=str(e))
+            return {}
+
     async def get_chain_tvl(self, chain: str) -> Optional[FactData]:
         """Get TVL for a specific chain.
 
@@ -134,35 +258,44 @@ class DefiLlamaSource(DataSource):
         Returns:
             FactData with chain TVL.
         """
+        chain_data = (await self._fetch_chains_index()).get(chain)  # assumes caller lowercased
+        if chain_data is not None:
+            return FactData(
+                source=self.name,
+                query=chain,
+                value=chain_data.get("tvl", 0),
+                unit="USD",
+                raw_data=chain_data,
+            )
+
+        return None
+
+    @_ttl_cache(60)
+    async def _fetch_pools_index(self) -> tuple[list[dict], dict[str, list[dict]]]:
+        """Fetch the full /pools dump and index it by project.
+
+        The endpoint takes no server-side filter, so the payload is
+        downloaded and scanned once per TTL window; per-protocol lookups
+        then hit the index instead of re-filtering thousands of pools.
+        """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/v2/chains",
-                    timeout=10.0,
-                )
+            response = await self._client.get("/pools", timeout=15.0)
 
-                if response.status_code != 200:
-                    return None
+            if response.status_code != 200:
+                return [], {}
 
-                chains = response.json()
+            data = orjson.loads(response.content)
+            pools = data.get("data", [])
 
-                # Find matching chain
-                chain_lower = chain.lower()
-                for chain_data in chains:
-                    if chain_data.get("name", "").lower() == chain_lower:
-                        return FactData(
-                            source=self.name,
-                            query=chain,
-                            value=chain_data.get("tvl", 0),
-                            unit="USD",
-                            raw_data=chain_data,
-                        )
+            by_project: dict[str, list[dict]] = {}
+            for pool in pools:
+                by_project.setdefault(pool.get("project", "").lower(), []).append(pool)
 
-                return None
+            return pools, by_project
 
         except Exception as e:
-            logger.error("defillama_chain_error", chain=chain, error=str(e))
-            return None
+            logger.error("defillama_yields_error", error=str(e))
+            return [], {}
 
     async def get_yields(self, protocol: Optional[str] = None) -> list[dict]:
         """Get yield data from DefiLlama.
@@ -173,31 +306,12 @@ class DefiLlamaSource(DataSource):
         Returns:
             List of yield pool data.
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/pools",
-                    timeout=15.0,
-                )
-
-                if response.status_code != 200:
-                    return []
-
-                data = response.json()
-                pools = data.get("data", [])
-
-                if protocol:
-                    protocol_lower = protocol.lower()
-                    pools = [
-                        p for p in pools
-                        if p.get("project", "").lower() == protocol_lower
-                    ]
+        pools, by_project = await self._fetch_pools_index()
 
-                return pools[:100]  # Limit results
+        if protocol:
+            return by_project.get(protocol, [])[:100]  # assumes caller lowercased
 
-        except Exception as e:
-            logger.error("defillama_yields_error", error=str(e))
-            return []
+        return pools[:100]  # Limit results
 
 
 class CoinGeckoSource(DataSource):
@@ -205,14 +319,29 @@ class CoinGeckoSource(DataSource):
 
     BASE_URL = "https://api.coingecko.com/api/v3"
 
+    def __init__(self):
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            # Both APIs speak h2; multiplexing lets the gather fan-out
+            # share one TCP+TLS connection instead of queueing on the pool
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
+
     @property
     def name(self) -> str:
         return "coingecko"
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
     async def query(self, query: str) -> Optional[FactData]:
         """Query CoinGecko for token data."""
         return await self.get_token_price(query)
 
+    @_ttl_cache(300)
     async def get_token_price(self, token_id: str) -> Optional[FactData]:
         """Get current price for a token.
 
@@ -222,33 +351,82 @@ class CoinGeckoSource(DataSource):
         Returns:
             FactData with price info.
         """
+        q = token_id  # assumes caller lowercased
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/simple/price",
-                    params={
-                        "ids": token_id.lower(),
-                        "vs_currencies": "usd",
-                        "include_market_cap": "true",
-                        "include_24hr_change": "true",
-                    },
-                    timeout=10.0,
-                )
+            response = await self._client.get(
+                "/simple/price",
+                params={
+                    "ids": q,
+                    "vs_currencies": "usd",
+                    "include_market_cap": "true",
+                    "include_24hr_change": "true",
+                },
+            )
+
+            if response.status_code != 200:
+                return None
 
-                if response.status_code != 200:
-                    return None
+            data = orjson.loads(response.content)
 
-                data = response.json()
+            if q not in data:
+                # Try searching by name
+                return await self._search_token(token_id)
 
-                if token_id.lower() not in data:
-                    # Try searching by name
-                    return await self._search_token(token_id)
+            token_data = data[q]
 
-                token_data = data[token_id.lower()]
+            return FactData(
+                source=self.name,
+                query=token_id,
+                value=token_data.get("usd", 0),
+                unit="USD",
+                raw_data={
+                    "price_usd": token_data.get("usd"),
+                    "market_cap": token_data.get("usd_market_cap"),
+                    "change_24h": token_data.get("usd_24h_change"),
+                },
+            )
 
-                return FactData(
+        except Exception as e:
+            logger.error("coingecko_price_error", token=token_id, error=str(e))
+            return None
+
+    async def get_token_prices(self, token_ids: list[str]) -> dict[str, FactData]:
+        """Get prices for several tokens in one request.
+
+        /simple/price accepts comma-separated ids, so N tokens cost one
+        round trip instead of N. Unknown ids are simply absent from the
+        result; callers fall back to the per-token path for those.
+
+        Args:
+            token_ids: CoinGecko token IDs.
+
+        Returns:
+            Mapping of lowercase token ID to FactData.
+        """
+        ids = sorted(set(token_ids))  # callers pass normalized lowercase ids
+        if not ids:
+            return {}
+
+        try:
+            response = await self._client.get(
+                "/simple/price",
+                params={
+                    "ids": ",".join(ids),
+                    "vs_currencies": "usd",
+                    "include_market_cap": "true",
+                    "include_24hr_change": "true",
+                },
+            )
+
+            if response.status_code != 200:
+                return {}
+
+            data = orjson.loads(response.content)
+
+            return {
+                q: FactData(
                     source=self.name,
-                    query=token_id,
+                    query=q,
                     value=token_data.get("usd", 0),
                     unit="USD",
                     raw_data={
@@ -257,10 +435,12 @@ class CoinGeckoSource(DataSource):
                         "change_24h": token_data.get("usd_24h_change"),
                     },
                 )
+                for q, token_data in data.items()
+            }
 
         except Exception as e:
-            logger.error("coingecko_price_error", token=token_id, error=str(e))
-            return None
+            logger.error("coingecko_bulk_price_error", error=str(e))
+            return {}
 
     async def _search_token(self, query: str) -> Optional[FactData]:
         """Search for a token by name/symbol.
@@ -272,25 +452,20 @@ class CoinGeckoSource(DataSource):
             FactData if found.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search",
-                    params={"query": query},
-                    timeout=10.0,
-                )
+            response = await self._client.get("/search", params={"query": query})
 
-                if response.status_code != 200:
-                    return None
+            if response.status_code != 200:
+                return None
 
-                data = response.json()
-                coins = data.get("coins", [])
+            data = orjson.loads(response.content)
+            coins = data.get("coins", [])
 
-                if not coins:
-                    return None
+            if not coins:
+                return None
 
-                # Get the top result
-                top_coin = coins[0]
-                return await self.get_token_price(top_coin["id"])
+            # Get the top result
+            top_coin = coins[0]
+            return await self.get_token_price(top_coin["id"])
 
         except Exception as e:
             logger.error("coingecko_search_error", query=query, error=str(e))
@@ -306,22 +481,20 @@ class CoinGeckoSource(DataSource):
             Token info dictionary.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/coins/{token_id.lower()}",
-                    params={
-                        "localization": "false",
-                        "tickers": "false",
-                        "community_data": "false",
-                        "developer_data": "false",
-                    },
-                    timeout=10.0,
-                )
-
-                if response.status_code != 200:
-                    return None
+            response = await self._client.get(
+                f"/coins/{token_id.lower()}",
+                params={
+                    "localization": "false",
+                    "tickers": "false",
+                    "community_data": "false",
+                    "developer_data": "false",
+                },
+            )
+
+            if response.status_code != 200:
+                return None
 
-                return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error("coingecko_info_error", token=token_id, error=str(e))
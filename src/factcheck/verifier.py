@@ -1,9 +1,11 @@
 """Fact verification service combining multiple data sources."""
 
+import asyncio
 import re
 import structlog
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 from .claim_extractor import ExtractedClaim, ClaimExtractor
 from .sources import DefiLlamaSource, CoinGeckoSource, FactData
@@ -13,7 +15,60 @@ from ..database.models import VerifiedFact, FactStatus
 logger = structlog.get_logger()
 
 
-@dataclass
+# Compiled once at import; one alternation covers both the monetary
+# number and the percentage patterns, so a claim is scanned exactly once.
+# The matched group name tells the extractor what it found.
+_VALUE_RE = re.compile(
+    r"(?P<pct>[\d.]+)\s*(?:%|процент|percent)"
+    r"|\$?(?P<billion>[\d.]+)\s*(?:billion|млрд)"
+    r"|\$?(?P<million>[\d.]+)\s*(?:million|млн|m)"
+    r"|\$?(?P<thousand>[\d.]+)\s*(?:thousand|тыс|k)"
+    r"|\$?(?P<plain>[\d.]+)"
+)
+_NUM_MULTIPLIERS = {"billion": 1e9, "million": 1e6, "thousand": 1e3}
+
+# Strips thousands separators and spaces in one pass; the patterns above
+# already tolerate separator-free input.
+_NUM_TRANS = str.maketrans("", "", ", ")
+
+
+def _extract_values(text: str) -> tuple[Optional[float], Optional[float]]:
+    """Extract the claimed number and percentage in one regex pass.
+
+    Returns:
+        (number, percentage) tuple; either element may be None. A value
+        with a billion/million/thousand suffix beats an earlier bare
+        number, mirroring the old per-pattern priority. The digits of a
+        percentage also count as a bare-number candidate — the separate
+        number pass used to match them too ("вырос на 15%" claims 15).
+    """
+    normalized = text.lower().translate(_NUM_TRANS)
+
+    number: Optional[float] = None
+    plain: Optional[float] = None
+    percentage: Optional[float] = None
+
+    for match in _VALUE_RE.finditer(normalized):
+        group = match.lastgroup
+        try:
+            value = float(match.group(group))
+        except ValueError:
+            continue
+        if group == "pct":
+            if percentage is None:
+                percentage = value
+            if plain is None:
+                plain = value
+        elif group == "plain":
+            if plain is None:
+                plain = value
+        elif number is None:
+            number = value * _NUM_MULTIPLIERS[group]
+
+    return number if number is not None else plain, percentage
+
+
+@dataclass(slots=True)
 class VerificationResult:
     """Result of fact verification."""
     claim: ExtractedClaim
@@ -27,11 +82,24 @@ class VerificationResult:
 class FactVerifier:
     """Verify claims using multiple data sources."""
 
+    # Built once at class creation instead of per format_fact_report call
+    _STATUS_EMOJI: ClassVar[dict[FactStatus, str]] = {
+        FactStatus.VERIFIED: "✅",
+        FactStatus.OUTDATED: "⚠️",
+        FactStatus.FALSE: "❌",
+        FactStatus.UNVERIFIED: "❓",
+    }
+
     def __init__(self):
         self.claim_extractor = ClaimExtractor()
         self.defillama = DefiLlamaSource()
         self.coingecko = CoinGeckoSource()
 
+    async def close(self) -> None:
+        """Release HTTP connections held by the data sources."""
+        await self.defillama.aclose()
+        await self.coingecko.aclose()
+
     async def verify_claims(
         self,
         transcript_text: str,
@@ -53,10 +121,47 @@ class FactVerifier:
             logger.info("no_claims_to_verify", video_id=video_id)
             return []
 
-        # Verify each claim
+        # Prefetch prices for every entity mentioned in price claims with
+        # one batched CoinGecko call; the per-claim path then reads from
+        # the dict instead of issuing a request per entity.
+        price_entities = {
+            e
+            for c in claims if c.category == "price"
+            for e in c.entities
+        }
+        price_cache = (
+            await self.coingecko.get_token_prices(list(price_entities))
+            if price_entities
+            else {}
+        )
+
+        # Verify all claims concurrently; the work is dominated by API
+        # round-trips, so wall time becomes max(RTT) instead of sum(RTT).
+        # The semaphore keeps us polite towards the public APIs.
+        sem = asyncio.Semaphore(10)
+
+        async def _verify_one(c: ExtractedClaim) -> VerificationResult:
+            async with sem:
+                return await self.verify_single_claim(c, price_cache)
+
+        results = await asyncio.gather(
+            *(_verify_one(c) for c in claims),
+            return_exceptions=True,
+        )
+
         verified_facts = []
-        for claim in claims:
-            result = await self.verify_single_claim(claim)
+        for claim, result in zip(claims, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "claim_verification_error",
+                    claim=claim.claim[:50],
+                    error=str(result),
+                )
+                result = VerificationResult(
+                    claim=claim,
+                    status=FactStatus.UNVERIFIED,
+                    notes="Verification failed",
+                )
 
             fact = VerifiedFact(
                 video_id=video_id,
@@ -75,54 +180,75 @@ class FactVerifier:
             )
 
         # Summary
-        status_counts = {}
-        for fact in verified_facts:
-            status_counts[fact.status.value] = status_counts.get(fact.status.value, 0) + 1
+        status_counts = Counter(f.status.value for f in verified_facts)
 
         logger.info(
             "verification_complete",
             video_id=video_id,
             total_claims=len(verified_facts),
-            status_counts=status_counts,
+            status_counts=dict(status_counts),
         )
 
         return verified_facts
 
-    async def verify_single_claim(self, claim: ExtractedClaim) -> VerificationResult:
+    async def verify_single_claim(
+        self,
+        claim: ExtractedClaim,
+        price_cache: Optional[dict[str, FactData]] = None,
+    ) -> VerificationResult:
         """Verify a single claim against data sources.
 
         Args:
             claim: Extracted claim to verify.
+            price_cache: Optional prefetched token prices keyed by
+                lowercase entity.
 
         Returns:
             VerificationResult with status and details.
         """
+        # Scan the claim text once; the branches reuse whichever value
+        # applies instead of re-running their own extraction regexes.
+        claimed_number, claimed_pct = _extract_values(claim.claim)
+
         # Try to verify based on category and entities
         if claim.category == "tvl":
-            return await self._verify_tvl_claim(claim)
+            return await self._verify_tvl_claim(claim, claimed_number)
         elif claim.category == "price":
-            return await self._verify_price_claim(claim)
+            return await self._verify_price_claim(claim, claimed_number, price_cache)
         elif claim.category == "percentage":
-            return await self._verify_yield_claim(claim)
+            return await self._verify_yield_claim(claim, claimed_pct)
         else:
             # For other categories, try general verification
             return await self._verify_general_claim(claim)
 
-    async def _verify_tvl_claim(self, claim: ExtractedClaim) -> VerificationResult:
+    async def _verify_tvl_claim(
+        self,
+        claim: ExtractedClaim,
+        claimed_value: Optional[float],
+    ) -> VerificationResult:
         """Verify TVL-related claims using DefiLlama.
 
         Args:
             claim: TVL claim to verify.
+            claimed_value: Number extracted from the claim text, if any.
 
         Returns:
             VerificationResult.
         """
-        for entity in claim.entities:
-            data = await self.defillama.get_protocol_tvl(entity)
+        # Nothing to look up — don't touch the API machinery at all
+        if not claim.entities:
+            return VerificationResult(
+                claim=claim,
+                status=FactStatus.UNVERIFIED,
+                notes="Could not find protocol data",
+            )
 
+        # Query all entities at once; the first one with data wins.
+        entity_data = await asyncio.gather(
+            *(self.defillama.get_protocol_tvl(e) for e in claim.entities)
+        )
+        for data in entity_data:
             if data:
-                # Extract claimed value from text
-                claimed_value = self._extract_number(claim.claim)
                 actual_value = data.value
 
                 if claimed_value:
@@ -161,20 +287,41 @@ class FactVerifier:
             notes="Could not find protocol data",
         )
 
-    async def _verify_price_claim(self, claim: ExtractedClaim) -> VerificationResult:
+    async def _verify_price_claim(
+        self,
+        claim: ExtractedClaim,
+        claimed_price: Optional[float],
+        price_cache: Optional[dict[str, FactData]] = None,
+    ) -> VerificationResult:
         """Verify price-related claims using CoinGecko.
 
         Args:
             claim: Price claim to verify.
+            claimed_price: Number extracted from the claim text, if any.
+            price_cache: Optional prefetched prices keyed by lowercase entity.
 
         Returns:
             VerificationResult.
         """
-        for entity in claim.entities:
-            data = await self.coingecko.get_token_price(entity)
+        if not claim.entities:
+            return VerificationResult(
+                claim=claim,
+                status=FactStatus.UNVERIFIED,
+                notes="Could not find token price",
+            )
 
+        async def _lookup(entity: str) -> Optional[FactData]:
+            if price_cache is not None:
+                hit = price_cache.get(entity)
+                if hit is not None:
+                    return hit
+            return await self.coingecko.get_token_price(entity)
+
+        entity_data = await asyncio.gather(
+            *(_lookup(e) for e in claim.entities)
+        )
+        for data in entity_data:
             if data:
-                claimed_price = self._extract_number(claim.claim)
                 actual_price = data.value
 
                 if claimed_price:
@@ -211,47 +358,60 @@ class FactVerifier:
             notes="Could not find token price",
         )
 
-    async def _verify_yield_claim(self, claim: ExtractedClaim) -> VerificationResult:
+    async def _verify_yield_claim(
+        self,
+        claim: ExtractedClaim,
+        claimed_apy: Optional[float],
+    ) -> VerificationResult:
         """Verify yield/APY claims using DefiLlama.
 
         Args:
             claim: Yield claim to verify.
+            claimed_apy: Percentage extracted from the claim text, if any.
 
         Returns:
             VerificationResult.
         """
-        for entity in claim.entities:
-            pools = await self.defillama.get_yields(entity)
-
-            if pools:
-                # Find the best matching pool
-                claimed_apy = self._extract_percentage(claim.claim)
-
-                for pool in pools[:10]:
-                    pool_apy = pool.get("apy", 0)
-                    if pool_apy and claimed_apy:
-                        ratio = pool_apy / claimed_apy if claimed_apy else 0
-                        if 0.7 <= ratio <= 1.3:
-                            return VerificationResult(
-                                claim=claim,
-                                status=FactStatus.VERIFIED,
-                                source=self.defillama.name,
-                                verified_value=f"{pool_apy:.1f}%",
-                                original_value=f"{claimed_apy:.1f}%",
-                                notes=f"Pool: {pool.get('pool', 'unknown')}",
-                            )
+        if not claim.entities:
+            return VerificationResult(
+                claim=claim,
+                status=FactStatus.UNVERIFIED,
+                notes="Could not verify yield data",
+            )
+
+        entity_pools = await asyncio.gather(
+            *(self.defillama.get_yields(e) for e in claim.entities)
+        )
+        for pools in entity_pools:
+            if pools and claimed_apy:
+                # Pull the APYs out once and compare against a precomputed
+                # acceptance band, so the scan is two float comparisons per
+                # pool with no division or repeated dict chains.
+                apys = [pool.get("apy") or 0.0 for pool in pools[:10]]
+                low, high = 0.7 * claimed_apy, 1.3 * claimed_apy
+
+                for pool, pool_apy in zip(pools, apys):
+                    if pool_apy and low <= pool_apy <= high:
+                        return VerificationResult(
+                            claim=claim,
+                            status=FactStatus.VERIFIED,
+                            source=self.defillama.name,
+                            verified_value=f"{pool_apy:.1f}%",
+                            original_value=f"{claimed_apy:.1f}%",
+                            notes=f"Pool: {pool.get('pool', 'unknown')}",
+                        )
 
                 # APY exists but doesn't match well
-                if pools and claimed_apy:
-                    avg_apy = sum(p.get("apy", 0) for p in pools[:5]) / min(5, len(pools))
-                    return VerificationResult(
-                        claim=claim,
-                        status=FactStatus.OUTDATED,
-                        source=self.defillama.name,
-                        verified_value=f"~{avg_apy:.1f}%",
-                        original_value=f"{claimed_apy:.1f}%",
-                        notes="APY may have changed",
-                    )
+                head = apys[:5]
+                avg_apy = sum(head) / len(head)
+                return VerificationResult(
+                    claim=claim,
+                    status=FactStatus.OUTDATED,
+                    source=self.defillama.name,
+                    verified_value=f"~{avg_apy:.1f}%",
+                    original_value=f"{claimed_apy:.1f}%",
+                    notes="APY may have changed",
+                )
 
         return VerificationResult(
             claim=claim,
@@ -268,9 +428,14 @@ class FactVerifier:
         Returns:
             VerificationResult.
         """
-        # Try each entity against both sources
+        # Probe entities in order and stop at the first hit, DefiLlama
+        # preferred per entity. Fanning every lookup out concurrently was
+        # tried here, but it issues 2*len(entities) requests even when
+        # the very first probe resolves; the common hit path should not
+        # cost more API calls than the sequential scan. The TTL caches in
+        # the sources keep repeat probes across claims cheap, and claims
+        # themselves are already verified concurrently.
         for entity in claim.entities:
-            # Try DefiLlama
             data = await self.defillama.query(entity)
             if data:
                 return VerificationResult(
@@ -281,7 +446,6 @@ class FactVerifier:
                     notes=f"Entity '{entity}' found",
                 )
 
-            # Try CoinGecko
             data = await self.coingecko.query(entity)
             if data:
                 return VerificationResult(
@@ -298,67 +462,6 @@ class FactVerifier:
             notes="No matching data found",
         )
 
-    def _extract_number(self, text: str) -> Optional[float]:
-        """Extract a number from text.
-
-        Handles formats like:
-        - $1.5 billion
-        - 1,500,000
-        - 1.5M
-        - $100
-
-        Args:
-            text: Text containing a number.
-
-        Returns:
-            Extracted number or None.
-        """
-        text = text.lower().replace(",", "").replace(" ", "")
-
-        # Find numbers with multipliers
-        patterns = [
-            (r"\$?([\d.]+)\s*(?:billion|млрд)", 1e9),
-            (r"\$?([\d.]+)\s*(?:million|млн|m)", 1e6),
-            (r"\$?([\d.]+)\s*(?:thousand|тыс|k)", 1e3),
-            (r"\$?([\d.]+)", 1),
-        ]
-
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    return float(match.group(1)) * multiplier
-                except ValueError:
-                    continue
-
-        return None
-
-    def _extract_percentage(self, text: str) -> Optional[float]:
-        """Extract a percentage from text.
-
-        Args:
-            text: Text containing a percentage.
-
-        Returns:
-            Extracted percentage or None.
-        """
-        # Match patterns like "15%", "15 процентов", "15.5%"
-        patterns = [
-            r"([\d.]+)\s*%",
-            r"([\d.]+)\s*процент",
-            r"([\d.]+)\s*percent",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    continue
-
-        return None
-
     def get_only_verified(
         self,
         facts: list[VerifiedFact],
@@ -382,14 +485,7 @@ class FactVerifier:
         Returns:
             Formatted string.
         """
-        status_emoji = {
-            FactStatus.VERIFIED: "✅",
-            FactStatus.OUTDATED: "⚠️",
-            FactStatus.FALSE: "❌",
-            FactStatus.UNVERIFIED: "❓",
-        }
-
-        emoji = status_emoji.get(fact.status, "❓")
+        emoji = self._STATUS_EMOJI.get(fact.status, "❓")
         source = f" [{fact.source}]" if fact.source else ""
         value = f" → {fact.verified_value}" if fact.verified_value else ""
 
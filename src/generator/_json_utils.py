@@ -0,0 +1,60 @@
+"""Shared JSON extraction for LLM responses."""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+import structlog
+
+
+logger = structlog.get_logger()
+
+
+# One compiled pattern replaces the chain of find/rfind substring scans
+# the parsers used to do: a single pass over the response matches either
+# a fenced ```json block or the outermost top-level object (greedy .*
+# under re.S reaches the last closing brace, like rfind did).
+_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```|(\{.*\})", re.S)
+
+
+@lru_cache(maxsize=256)
+def extract_json_payload(text: str) -> Optional[str]:
+    """Return the JSON object substring of an LLM response, unparsed.
+
+    For callers that feed the payload to a typed decoder instead of
+    building an intermediate dict. Cached so fallback re-parses of the
+    same response skip the regex scan.
+
+    Args:
+        text: Response text, possibly wrapped in markdown fences or prose.
+
+    Returns:
+        The JSON substring or None.
+    """
+    m = _JSON_RE.search(text)
+    if not m:
+        return None
+    return m.group(1) or m.group(2)
+
+
+def extract_json_object(text: str) -> Optional[dict]:
+    """Pull the JSON object out of an LLM response.
+
+    Args:
+        text: Response text, possibly wrapped in markdown fences or prose.
+
+    Returns:
+        Parsed dictionary or None.
+    """
+    payload = extract_json_payload(text)
+    if payload is None:
+        return None
+
+    try:
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError as e:
+        logger.warning("json_parse_error", error=str(e))
+        return None
+
+    return data if isinstance(data, dict) else None
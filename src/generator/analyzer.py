@@ -1,15 +1,19 @@
 """Video structure analyzer using LLM."""
 
-import json
+import asyncio
+import io
+
+import orjson
 import structlog
 from dataclasses import dataclass
 from typing import Optional
 
-import anthropic
-import openai
-
 from ..config import get_config
+from ..llm import call_with_retry, get_llm_client
 from ..transcript.extractor import VideoTranscript
+from ._json_utils import extract_json_object
+from .compress import compress_transcript
+from .llm_cache import LLMCache
 
 
 logger = structlog.get_logger()
@@ -29,7 +33,12 @@ class VideoStructure:
     estimated_duration_minutes: int
 
 
-STRUCTURE_ANALYSIS_PROMPT = """Ты эксперт по анализу YouTube видео. Проанализируй структуру следующего транскрипта видео о DeFi/криптовалютах.
+# The instructions never change between videos, so they live in the
+# system prompt: Anthropic caches the block server-side via
+# cache_control, and for OpenAI the constant prefix maximizes the
+# provider's automatic prefix-cache hit rate. Only the transcript
+# travels in the user message.
+STRUCTURE_SYSTEM_PROMPT = """Ты эксперт по анализу YouTube видео. Проанализируй структуру транскрипта видео о DeFi/криптовалютах, который пришлёт пользователь.
 
 Определи:
 1. hook - захватывающий крючок в начале (цитата или пересказ)
@@ -42,27 +51,45 @@ STRUCTURE_ANALYSIS_PROMPT = """Ты эксперт по анализу YouTube 
 8. target_audience - целевая аудитория
 9. estimated_duration_minutes - примерная длительность в минутах
 
-Транскрипт:
+Верни JSON объект с этими полями. Для main_points и examples верни массивы строк."""
+
+
+STRUCTURE_USER_PROMPT = """Транскрипт:
 ---
 {transcript}
----
+---"""
 
-Верни JSON объект с этими полями. Для main_points и examples верни массивы строк."""
+
+_SYSTEM_BLOCK = [
+    {
+        "type": "text",
+        "text": STRUCTURE_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
 
 
 class StructureAnalyzer:
     """Analyze video structure using LLM."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMCache] = None):
         config = get_config()
         self.provider = config.llm.provider
-        self.model = config.llm.model
+        self.model = config.llm.analysis_model or config.llm.model
         self.api_key = config.llm.api_key
+        self._cache = cache
+
+        # Shared async client: one connection pool across the extractor,
+        # analyzer and writer.
+        self.client = get_llm_client(self.provider, self.api_key)
 
-        if self.provider == "anthropic":
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-        else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+        # Provider dispatch resolved once here instead of branching on
+        # every call.
+        self._call = (
+            self._call_anthropic
+            if self.provider == "anthropic"
+            else self._call_openai
+        )
 
     async def analyze(self, transcript: VideoTranscript) -> Optional[VideoStructure]:
         """Analyze video structure from transcript.
@@ -73,52 +100,42 @@ class StructureAnalyzer:
         Returns:
             VideoStructure or None on error.
         """
-        text = transcript.full_text
+        # Compress locally before spending prefill tokens on caption noise
+        text = compress_transcript(transcript.full_text)
 
         if not text or len(text) < 100:
             logger.warning("transcript_too_short", video_id=transcript.video_id)
             return None
 
-        # Truncate very long transcripts
+        # Safety cap; compression normally lands well under this
         if len(text) > 20000:
             text = text[:20000] + "..."
 
         try:
-            prompt = STRUCTURE_ANALYSIS_PROMPT.format(transcript=text)
+            prompt = STRUCTURE_USER_PROMPT.format(transcript=text)
 
-            if self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=2048,
-                    messages=[{"role": "user", "content": prompt}],
+            cache_key = None
+            response_text = None
+            if self._cache is not None:
+                cache_key = LLMCache.prompt_key(
+                    self.model, STRUCTURE_SYSTEM_PROMPT + "\x00" + prompt
                 )
-                response_text = response.content[0].text
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=2048,
-                )
-                response_text = response.choices[0].message.content
+                response_text = await self._cache.get(cache_key)
+
+            if response_text is None:
+                response_text = await call_with_retry(self._call, prompt, 800)
+
+                if self._cache is not None:
+                    await self._cache.set(cache_key, response_text)
 
             # Parse JSON response
-            data = self._parse_json_response(response_text)
+            data = extract_json_object(response_text)
 
             if not data:
                 logger.warning("could_not_parse_structure", video_id=transcript.video_id)
                 return None
 
-            structure = VideoStructure(
-                hook=data.get("hook", ""),
-                intro=data.get("intro", ""),
-                main_points=data.get("main_points", []),
-                examples=data.get("examples", []),
-                cta=data.get("cta", ""),
-                outro=data.get("outro", ""),
-                tone=data.get("tone", ""),
-                target_audience=data.get("target_audience", ""),
-                estimated_duration_minutes=data.get("estimated_duration_minutes", 10),
-            )
+            structure = self._structure_from_dict(data)
 
             logger.info(
                 "structure_analyzed",
@@ -133,38 +150,185 @@ class StructureAnalyzer:
             logger.error("structure_analysis_error", error=str(e))
             return None
 
-    def _parse_json_response(self, text: str) -> Optional[dict]:
-        """Parse JSON from LLM response.
+    async def _call_anthropic(self, prompt: str, max_tokens: int) -> str:
+        """Stream one completion through the Anthropic SDK.
+
+        Streaming accumulates chunks as they arrive: tokens are consumed
+        during the decode phase instead of waiting for the provider to
+        assemble the full response before returning.
+        """
+        chunks: list[str] = []
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=_SYSTEM_BLOCK,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text_chunk in stream.text_stream:
+                chunks.append(text_chunk)
+        return "".join(chunks)
+
+    async def _call_openai(self, prompt: str, max_tokens: int) -> str:
+        """Stream one completion through the OpenAI SDK."""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": STRUCTURE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        chunks: list[str] = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                chunks.append(delta)
+        return "".join(chunks)
+
+    async def analyze_batch(
+        self,
+        transcripts: list[VideoTranscript],
+    ) -> dict[str, VideoStructure]:
+        """Analyze several transcripts through the provider batch API.
+
+        The monitoring cycle is scheduled, not interactive, so a
+        multi-minute batch turnaround is acceptable in exchange for the
+        batch-tier pricing and throughput. Videos missing from the result
+        (failed requests, unparseable responses) simply fall back to the
+        per-video path.
 
         Args:
-            text: Response text.
+            transcripts: Transcripts of the viral videos to analyze.
 
         Returns:
-            Parsed dictionary or None.
+            Mapping of video_id to VideoStructure for successful analyses.
         """
-        text = text.strip()
-
-        # Handle markdown code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
-
-        # Find object boundaries
-        if "{" in text:
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            text = text[start:end]
+        prompts: dict[str, str] = {}
+        for transcript in transcripts:
+            text = compress_transcript(transcript.full_text)
+            if not text or len(text) < 100:
+                continue
+            if len(text) > 20000:
+                text = text[:20000] + "..."
+            prompts[transcript.video_id] = STRUCTURE_USER_PROMPT.format(
+                transcript=text
+            )
+
+        if not prompts:
+            return {}
 
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
-            logger.warning("json_parse_error", error=str(e))
-            return None
+            if self.provider == "anthropic":
+                raw = await self._batch_anthropic(prompts)
+            else:
+                raw = await self._batch_openai(prompts)
+        except Exception as e:
+            logger.error("batch_analysis_error", error=str(e))
+            return {}
+
+        structures: dict[str, VideoStructure] = {}
+        for video_id, response_text in raw.items():
+            data = extract_json_object(response_text)
+            if data:
+                structures[video_id] = self._structure_from_dict(data)
+
+        logger.info(
+            "batch_analysis_complete",
+            requested=len(prompts),
+            analyzed=len(structures),
+        )
+        return structures
+
+    async def _batch_anthropic(self, prompts: dict[str, str]) -> dict[str, str]:
+        """Run the prompts through the Anthropic message batches API."""
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": video_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": 800,
+                        "system": _SYSTEM_BLOCK,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for video_id, prompt in prompts.items()
+            ]
+        )
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(10)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        results: dict[str, str] = {}
+        async for item in self.client.messages.batches.results(batch.id):
+            if item.result.type == "succeeded":
+                results[item.custom_id] = item.result.message.content[0].text
+        return results
+
+    async def _batch_openai(self, prompts: dict[str, str]) -> dict[str, str]:
+        """Run the prompts through the OpenAI batch API."""
+        payload = b"\n".join(
+            orjson.dumps(
+                {
+                    "custom_id": video_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "system", "content": STRUCTURE_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt},
+                        ],
+                        "max_tokens": 800,
+                    },
+                }
+            )
+            for video_id, prompt in prompts.items()
+        )
+
+        input_file = await self.client.files.create(
+            file=("structure_batch.jsonl", payload), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(10)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning("openai_batch_incomplete", status=batch.status)
+            return {}
+
+        content = await self.client.files.content(batch.output_file_id)
+        results: dict[str, str] = {}
+        for line in content.text.splitlines():
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                results[item["custom_id"]] = (
+                    response["body"]["choices"][0]["message"]["content"]
+                )
+        return results
+
+    def _structure_from_dict(self, data: dict) -> VideoStructure:
+        """Build a VideoStructure from a parsed response dict."""
+        return VideoStructure(
+            hook=data.get("hook", ""),
+            intro=data.get("intro", ""),
+            main_points=data.get("main_points", []),
+            examples=data.get("examples", []),
+            cta=data.get("cta", ""),
+            outro=data.get("outro", ""),
+            tone=data.get("tone", ""),
+            target_audience=data.get("target_audience", ""),
+            estimated_duration_minutes=data.get("estimated_duration_minutes", 10),
+        )
 
     def structure_to_dict(self, structure: VideoStructure) -> dict:
         """Convert structure to dictionary for storage.
@@ -196,21 +360,20 @@ class StructureAnalyzer:
         Returns:
             Formatted string.
         """
-        lines = [
-            f"🎯 Целевая аудитория: {structure.target_audience}",
-            f"🎭 Тон: {structure.tone}",
-            f"⏱ Длительность: ~{structure.estimated_duration_minutes} мин",
-            "",
-            "📌 Основные пункты:",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+
+        w("🎯 Целевая аудитория: %s\n" % structure.target_audience)
+        w("🎭 Тон: %s\n" % structure.tone)
+        w("⏱ Длительность: ~%d мин\n\n" % structure.estimated_duration_minutes)
+        w("📌 Основные пункты:")
 
         for i, point in enumerate(structure.main_points, 1):
-            lines.append(f"  {i}. {point}")
+            w("\n  %d. %s" % (i, point))
 
         if structure.examples:
-            lines.append("")
-            lines.append("💡 Примеры:")
+            w("\n\n💡 Примеры:")
             for example in structure.examples[:5]:
-                lines.append(f"  • {example}")
+                w("\n  • %s" % example)
 
-        return "\n".join(lines)
+        return buf.getvalue()
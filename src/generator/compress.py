@@ -0,0 +1,78 @@
+"""Local transcript compression to cut LLM prefill tokens."""
+
+import re
+
+
+# Caption event tags auto-inserted by YouTube ("[музыка]", "(applause)").
+_TAG_RE = re.compile(
+    r"[\[(]\s*(?:аплодисменты|музыка|смех|applause|music|laughter)\s*[\])]",
+    re.IGNORECASE,
+)
+
+_WS_RE = re.compile(r"\s+")
+
+# A sentence is a run of non-terminator characters plus its terminators.
+_SENT_RE = re.compile(r"[^.!?]+[.!?]*")
+
+# Shingle tokens are bare words, so "...доходность." and "...доходность!"
+# dedup against each other.
+_WORD_RE = re.compile(r"\w+")
+
+# Word-shingle width for the duplicate-sentence check.
+_SHINGLE = 6
+
+
+def compress_transcript(text: str, target_chars: int = 8000) -> str:
+    """Shrink a transcript before it is shipped to the LLM.
+
+    Auto-generated captions are noisy: event tags, irregular whitespace
+    and near-verbatim repeated lines all inflate prefill tokens without
+    adding signal. This strips the tags, collapses whitespace, drops
+    sentences whose word shingles were all seen before, and stops at a
+    sentence boundary once the target size is reached — instead of the
+    mid-word hard slice the analyzer used to do.
+
+    Args:
+        text: Raw transcript text.
+        target_chars: Approximate output size; the last sentence may
+            overshoot it slightly.
+
+    Returns:
+        Compressed transcript text.
+    """
+    if not text:
+        return ""
+
+    text = _TAG_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
+
+    kept: list[str] = []
+    seen: set[tuple[str, ...]] = set()
+    total = 0
+
+    for m in _SENT_RE.finditer(text):
+        sentence = m.group().strip()
+        if not sentence:
+            continue
+
+        words = _WORD_RE.findall(sentence.lower())
+        if len(words) >= _SHINGLE:
+            shingles = {
+                tuple(words[i : i + _SHINGLE])
+                for i in range(len(words) - _SHINGLE + 1)
+            }
+        else:
+            shingles = {tuple(words)}
+
+        # Every shingle already emitted: a repeated caption line.
+        if shingles <= seen:
+            continue
+
+        seen |= shingles
+        kept.append(sentence)
+        total += len(sentence) + 1
+
+        if total >= target_chars:
+            break
+
+    return " ".join(kept)
@@ -0,0 +1,81 @@
+"""Exact-match cache for LLM responses backed by SQLite."""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+import structlog
+
+
+logger = structlog.get_logger()
+
+
+class LLMCache:
+    """Cache LLM completions keyed on a hash of the full prompt.
+
+    A hit skips the round trip entirely, which matters on pipeline
+    re-runs: the prompt for an already-processed transcript is
+    byte-identical, so the exact SHA-256 key catches it. Entries expire
+    after a TTL so stale market data does not leak into new scripts.
+    """
+
+    def __init__(self, db_path: str = "data/llm_cache.db", ttl_days: int = 30):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self._connection: Optional[aiosqlite.Connection] = None
+
+    async def connect(self) -> None:
+        """Open the cache database, creating it if needed."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = await aiosqlite.connect(self.db_path)
+        await self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        await self._connection.commit()
+        logger.info("llm_cache_connected", path=self.db_path)
+
+    async def close(self) -> None:
+        """Close the cache database."""
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def prompt_key(model: str, prompt: str) -> str:
+        """Derive the cache key for a (model, prompt) pair."""
+        return hashlib.sha256(f"{model}\x00{prompt}".encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response; returns None on miss or expiry."""
+        if self._connection is None:
+            return None
+
+        async with self._connection.execute(
+            "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None or time.time() - row[1] >= self.ttl_seconds:
+            return None
+
+        logger.info("llm_cache_hit", key=key[:12])
+        return row[0]
+
+    async def set(self, key: str, response: str) -> None:
+        """Store a response under the given key."""
+        if self._connection is None or not response:
+            return
+
+        await self._connection.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+            (key, response, time.time()),
+        )
+        await self._connection.commit()
@@ -1,21 +1,44 @@
 """Script generator that creates original content based on analyzed structure."""
 
+import asyncio
+import io
+
+import msgspec
 import structlog
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import anthropic
-import openai
-
 from ..config import get_config
 from ..database.models import VerifiedFact, FactStatus
+from ..llm import call_with_retry, get_llm_client
+from ..transcript.extractor import VideoTranscript
+from ._json_utils import extract_json_object, extract_json_payload
 from .analyzer import VideoStructure
+from .llm_cache import LLMCache
 
 
 logger = structlog.get_logger()
 
 
+class _ScriptRaw(msgspec.Struct):
+    """Typed view of the script JSON the LLM returns.
+
+    The schema is fixed, so a compiled msgspec decoder deserializes the
+    response straight into this struct — no intermediate dict and no
+    per-field .get() lookups.
+    """
+    topic: str = ""
+    hook: str = ""
+    intro: str = ""
+    sections: list[dict] = []
+    cta: str = ""
+    outro: str = ""
+
+
+_SCRIPT_DECODER = msgspec.json.Decoder(_ScriptRaw)
+
+
 @dataclass
 class GeneratedScript:
     """Generated video script."""
@@ -30,9 +53,21 @@ class GeneratedScript:
     estimated_duration_minutes: int
 
 
-SCRIPT_GENERATION_PROMPT = """Ты опытный YouTube-сценарист, специализирующийся на DeFi и криптовалютах.
+# The persona and style block are identical for every call, so they
+# live in the system prompt: Anthropic caches the block server-side via
+# cache_control, and for OpenAI the constant prefix maximizes the
+# provider's automatic prefix-cache hit rate. Only per-video fields
+# travel in the user message.
+STYLE_SYSTEM_PROMPT = """Ты опытный YouTube-сценарист, специализирующийся на DeFi и криптовалютах.
 
-ЗАДАЧА: Напиши ОРИГИНАЛЬНЫЙ сценарий на тему "{topic}" для YouTube видео.
+СТИЛЬ АВТОРА:
+{style_guide}
+
+ПРИМЕРЫ СТИЛЯ АВТОРА:
+{style_examples}"""
+
+
+SCRIPT_GENERATION_PROMPT = """ЗАДАЧА: Напиши ОРИГИНАЛЬНЫЙ сценарий на тему "{topic}" для YouTube видео.
 
 СТРУКТУРА УСПЕШНОГО ВИДЕО (референс):
 {structure_summary}
@@ -40,12 +75,6 @@ SCRIPT_GENERATION_PROMPT = """Ты опытный YouTube-сценарист, с
 ПРОВЕРЕННЫЕ ФАКТЫ (используй только их):
 {verified_facts}
 
-СТИЛЬ АВТОРА:
-{style_guide}
-
-ПРИМЕРЫ СТИЛЯ АВТОРА:
-{style_examples}
-
 ТРЕБОВАНИЯ:
 1. Создай ПОЛНОСТЬЮ ОРИГИНАЛЬНЫЙ контент - не копируй исходное видео
 2. Используй ТОЛЬКО проверенные факты из списка выше
@@ -70,23 +99,97 @@ SCRIPT_GENERATION_PROMPT = """Ты опытный YouTube-сценарист, с
 Напиши сценарий:"""
 
 
+COMBINED_ANALYSIS_PROMPT = """ЗАДАЧА (два шага в одном ответе):
+1. Проанализируй структуру транскрипта успешного видео ниже.
+2. Напиши ПОЛНОСТЬЮ ОРИГИНАЛЬНЫЙ сценарий на тему "{topic}" по этой структуре.
+
+ТРАНСКРИПТ УСПЕШНОГО ВИДЕО (референс):
+---
+{transcript}
+---
+
+ПРОВЕРЕННЫЕ ФАКТЫ (используй только их):
+{verified_facts}
+
+ТРЕБОВАНИЯ К СЦЕНАРИЮ:
+1. Создай ПОЛНОСТЬЮ ОРИГИНАЛЬНЫЙ контент - не копируй исходное видео
+2. Используй ТОЛЬКО проверенные факты из списка выше
+3. Сохрани структуру успешного видео (крючок → intro → основные пункты → CTA → outro)
+4. Пиши в стиле автора - {author_name}
+5. Язык: русский
+6. Длительность: сопоставимая с референсом
+
+ФОРМАТ ОТВЕТА - один JSON объект с двумя ключами:
+{{
+    "structure": {{
+        "hook": "Крючок референса",
+        "intro": "Введение референса",
+        "main_points": ["пункт 1", "пункт 2"],
+        "examples": ["пример 1"],
+        "cta": "CTA референса",
+        "outro": "Закрытие референса",
+        "tone": "тон подачи",
+        "target_audience": "целевая аудитория",
+        "estimated_duration_minutes": 10
+    }},
+    "script": {{
+        "topic": "Тема видео",
+        "hook": "Захватывающее начало (1-2 предложения)",
+        "intro": "Введение в тему (2-3 предложения)",
+        "sections": [
+            {{"title": "Название раздела 1", "content": "Контент раздела..."}}
+        ],
+        "cta": "Призыв к действию",
+        "outro": "Завершение видео"
+    }}
+}}
+
+Ответ:"""
+
+
 class ScriptWriter:
     """Generate original video scripts based on analyzed structure."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMCache] = None):
         config = get_config()
         self.provider = config.llm.provider
-        self.model = config.llm.model
+        self.model = config.llm.writer_model or config.llm.model
         self.api_key = config.llm.api_key
         self.style_config = config.style
+        self._cache = cache
+
+        self.client = get_llm_client(self.provider, self.api_key)
 
-        if self.provider == "anthropic":
-            self.client = anthropic.Anthropic(api_key=self.api_key)
-        else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+        # Provider dispatch resolved once here instead of branching on
+        # every call.
+        self._call = (
+            self._call_anthropic
+            if self.provider == "anthropic"
+            else self._call_openai
+        )
 
-        # Load style examples
-        self.style_examples = self._load_style_examples()
+        # The system prompt needs the style-examples file; that read (and
+        # the one-time prompt assembly) is deferred to first use so
+        # construction never touches the disk.
+        self._system_prompt: Optional[str] = None
+        self._system_block: Optional[list[dict]] = None
+
+        # Pre-fill both user templates once here. The format pass also
+        # collapses the {{ }} JSON escapes, leaving only the per-call
+        # {placeholder} tokens for a plain str.replace at call time.
+        self._script_prompt = SCRIPT_GENERATION_PROMPT.format(
+            topic="{topic}",
+            structure_summary="{structure_summary}",
+            verified_facts="{verified_facts}",
+            author_name=self.style_config.author_name,
+            duration="{duration}",
+        )
+        self._combined_prompt = COMBINED_ANALYSIS_PROMPT.format(
+            topic="{topic}",
+            transcript="{transcript}",
+            verified_facts="{verified_facts}",
+            author_name=self.style_config.author_name,
+        )
 
     def _load_style_examples(self) -> str:
         """Load style examples from file.
@@ -104,6 +207,33 @@ class ScriptWriter:
 
         return "Примеры стиля не загружены. Используй естественный разговорный стиль."
 
+    async def _ensure_style_prompts(self) -> None:
+        """Load style examples and build the system prompt on first use.
+
+        The file read runs in a worker thread so neither startup nor the
+        first generation call blocks the event loop on disk I/O; the
+        trimmed result is cached for every later call.
+        """
+        if self._system_prompt is not None:
+            return
+
+        examples = await asyncio.to_thread(self._load_style_examples)
+        style_guide = f"""
+Тон: {self.style_config.tone}
+Язык: {self.style_config.language}
+"""
+        self._system_prompt = STYLE_SYSTEM_PROMPT.format(
+            style_guide=style_guide,
+            style_examples=examples[:3000],  # Limit examples
+        )
+        self._system_block = [
+            {
+                "type": "text",
+                "text": self._system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     async def generate_script(
         self,
         topic: str,
@@ -128,37 +258,30 @@ class ScriptWriter:
         # Format verified facts
         facts_text = self._format_facts_for_prompt(verified_facts)
 
-        # Style guide
-        style_guide = f"""
-Тон: {self.style_config.tone}
-Язык: {self.style_config.language}
-"""
-
         try:
-            prompt = SCRIPT_GENERATION_PROMPT.format(
-                topic=topic,
-                structure_summary=structure_summary,
-                verified_facts=facts_text,
-                style_guide=style_guide,
-                style_examples=self.style_examples[:3000],  # Limit examples
-                author_name=self.style_config.author_name,
-                duration=target_duration,
+            await self._ensure_style_prompts()
+
+            prompt = (
+                self._script_prompt
+                .replace("{topic}", topic)
+                .replace("{structure_summary}", structure_summary)
+                .replace("{verified_facts}", facts_text)
+                .replace("{duration}", str(target_duration))
             )
 
-            if self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                response_text = response.content[0].text
-            else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=4096,
+            cache_key = None
+            response_text = None
+            if self._cache is not None:
+                cache_key = LLMCache.prompt_key(
+                    self.model, self._system_prompt + "\x00" + prompt
                 )
-                response_text = response.choices[0].message.content
+                response_text = await self._cache.get(cache_key)
+
+            if response_text is None:
+                response_text = await call_with_retry(self._call, prompt, 4096)
+
+                if self._cache is not None:
+                    await self._cache.set(cache_key, response_text)
 
             # Parse response
             script = self._parse_script_response(response_text, topic)
@@ -177,6 +300,128 @@ class ScriptWriter:
             logger.error("script_generation_error", error=str(e), topic=topic)
             return None
 
+    async def analyze_and_generate(
+        self,
+        transcript: VideoTranscript,
+        topic: str,
+        verified_facts: list[VerifiedFact],
+    ) -> tuple[Optional[VideoStructure], Optional[GeneratedScript]]:
+        """Analyze the reference video and draft the script in one call.
+
+        The structure analysis is only consumed to condition the script
+        prompt, so fusing both steps into a single request halves the LLM
+        round trips per video. Callers should fall back to the two-step
+        analyze + generate_script path when this returns no script.
+
+        Args:
+            transcript: Reference video transcript.
+            topic: Video topic.
+            verified_facts: List of verified facts to use.
+
+        Returns:
+            (VideoStructure, GeneratedScript) tuple; either may be None.
+        """
+        text = transcript.full_text
+        if not text or len(text) < 100:
+            logger.warning("transcript_too_short", video_id=transcript.video_id)
+            return None, None
+
+        if len(text) > 20000:
+            text = text[:20000] + "..."
+
+        facts_text = self._format_facts_for_prompt(verified_facts)
+
+        try:
+            await self._ensure_style_prompts()
+
+            prompt = (
+                self._combined_prompt
+                .replace("{topic}", topic)
+                .replace("{transcript}", text)
+                .replace("{verified_facts}", facts_text)
+            )
+
+            cache_key = None
+            response_text = None
+            if self._cache is not None:
+                cache_key = LLMCache.prompt_key(
+                    self.model, self._system_prompt + "\x00" + prompt
+                )
+                response_text = await self._cache.get(cache_key)
+
+            if response_text is None:
+                response_text = await call_with_retry(self._call, prompt, 6144)
+
+                if self._cache is not None:
+                    await self._cache.set(cache_key, response_text)
+
+            data = extract_json_object(response_text)
+            if not data:
+                logger.warning("combined_parse_failed", topic=topic)
+                return None, None
+
+            structure_data = data.get("structure")
+            script_data = data.get("script")
+            if not isinstance(script_data, dict):
+                logger.warning("combined_missing_script", topic=topic)
+                return None, None
+
+            structure = None
+            if isinstance(structure_data, dict):
+                structure = VideoStructure(
+                    hook=structure_data.get("hook", ""),
+                    intro=structure_data.get("intro", ""),
+                    main_points=structure_data.get("main_points", []),
+                    examples=structure_data.get("examples", []),
+                    cta=structure_data.get("cta", ""),
+                    outro=structure_data.get("outro", ""),
+                    tone=structure_data.get("tone", ""),
+                    target_audience=structure_data.get("target_audience", ""),
+                    estimated_duration_minutes=structure_data.get(
+                        "estimated_duration_minutes", 10
+                    ),
+                )
+
+            script = self._build_script(
+                msgspec.convert(script_data, _ScriptRaw), topic
+            )
+            if script:
+                logger.info(
+                    "script_generated",
+                    topic=topic,
+                    word_count=script.word_count,
+                    sections=len(script.sections),
+                    fused=True,
+                )
+
+            return structure, script
+
+        except Exception as e:
+            logger.error("combined_generation_error", error=str(e), topic=topic)
+            return None, None
+
+    async def _call_anthropic(self, prompt: str, max_tokens: int) -> str:
+        """Run one completion through the Anthropic SDK."""
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=self._system_block,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.content[0].text
+
+    async def _call_openai(self, prompt: str, max_tokens: int) -> str:
+        """Run one completion through the OpenAI SDK."""
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+
     def _format_structure_for_prompt(self, structure: VideoStructure) -> str:
         """Format video structure for the prompt.
 
@@ -186,23 +431,22 @@ class ScriptWriter:
         Returns:
             Formatted string.
         """
-        lines = [
-            f"Крючок: {structure.hook}",
-            f"Введение: {structure.intro}",
-            "Основные пункты:",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+
+        w("Крючок: %s\n" % structure.hook)
+        w("Введение: %s\n" % structure.intro)
+        w("Основные пункты:\n")
 
         for i, point in enumerate(structure.main_points, 1):
-            lines.append(f"  {i}. {point}")
+            w("  %d. %s\n" % (i, point))
 
-        lines.extend([
-            f"CTA: {structure.cta}",
-            f"Закрытие: {structure.outro}",
-            f"Тон: {structure.tone}",
-            f"Аудитория: {structure.target_audience}",
-        ])
+        w("CTA: %s\n" % structure.cta)
+        w("Закрытие: %s\n" % structure.outro)
+        w("Тон: %s\n" % structure.tone)
+        w("Аудитория: %s" % structure.target_audience)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _format_facts_for_prompt(self, facts: list[VerifiedFact]) -> str:
         """Format verified facts for the prompt.
@@ -247,61 +491,55 @@ class ScriptWriter:
         Returns:
             GeneratedScript or None.
         """
-        import json
-
-        text = text.strip()
-
-        # Handle markdown code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
-
-        # Find JSON object
-        if "{" in text:
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            text = text[start:end]
+        payload = extract_json_payload(text)
+        if payload is not None:
+            try:
+                return self._build_script(_SCRIPT_DECODER.decode(payload), topic)
+            except msgspec.DecodeError as e:
+                logger.warning("script_json_parse_error", error=str(e))
 
-        try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
-            logger.warning("script_json_parse_error", error=str(e))
-            # Try to extract content manually
-            return self._fallback_parse(text, topic)
+        # Try to extract content manually
+        return self._fallback_parse(text, topic)
 
+    def _build_script(self, raw: _ScriptRaw, topic: str) -> Optional[GeneratedScript]:
+        """Assemble a GeneratedScript from the decoded response.
+
+        Args:
+            raw: Decoded script fields.
+            topic: Original topic.
+
+        Returns:
+            GeneratedScript or None.
+        """
         # Build full text
-        sections = data.get("sections", [])
-        full_text_parts = [
-            data.get("hook", ""),
-            data.get("intro", ""),
-        ]
+        full_text_parts = [raw.hook, raw.intro]
 
-        for section in sections:
-            if isinstance(section, dict):
-                full_text_parts.append(f"\n{section.get('title', '')}\n")
-                full_text_parts.append(section.get("content", ""))
+        for section in raw.sections:
+            full_text_parts.append(f"\n{section.get('title', '')}\n")
+            full_text_parts.append(section.get("content", ""))
+
+        full_text_parts.extend([raw.cta, raw.outro])
 
-        full_text_parts.extend([
-            data.get("cta", ""),
-            data.get("outro", ""),
-        ])
+        # Count words per part during assembly; parts never share a word
+        # across the \n\n joins, so this equals a split() of the joined
+        # string without re-walking the multi-KB result.
+        parts: list[str] = []
+        word_count = 0
+        for p in full_text_parts:
+            if p:
+                parts.append(p)
+                word_count += len(p.split())
 
-        full_text = "\n\n".join(p for p in full_text_parts if p)
-        word_count = len(full_text.split())
+        full_text = "\n\n".join(parts)
         estimated_duration = max(1, word_count // 150)  # ~150 words per minute
 
         return GeneratedScript(
-            topic=data.get("topic", topic),
-            hook=data.get("hook", ""),
-            intro=data.get("intro", ""),
-            sections=sections,
-            cta=data.get("cta", ""),
-            outro=data.get("outro", ""),
+            topic=raw.topic or topic,
+            hook=raw.hook,
+            intro=raw.intro,
+            sections=raw.sections,
+            cta=raw.cta,
+            outro=raw.outro,
             full_text=full_text,
             word_count=word_count,
             estimated_duration_minutes=estimated_duration,
@@ -343,31 +581,30 @@ class ScriptWriter:
         Returns:
             Formatted string.
         """
-        lines = [
-            f"📝 СЦЕНАРИЙ: {script.topic}",
-            f"📊 {script.word_count} слов | ~{script.estimated_duration_minutes} мин",
-            "",
-            "═" * 40,
-            "",
-            f"🎣 КРЮЧОК:\n{script.hook}",
-            "",
-            f"📖 ВВЕДЕНИЕ:\n{script.intro}",
-            "",
-        ]
+        # Single growing buffer instead of a list of per-line f-strings;
+        # sections can make this string large.
+        buf = io.StringIO()
+        w = buf.write
+
+        w("📝 СЦЕНАРИЙ: %s\n" % script.topic)
+        w(
+            "📊 %d слов | ~%d мин\n\n"
+            % (script.word_count, script.estimated_duration_minutes)
+        )
+        w("═" * 40)
+        w("\n\n🎣 КРЮЧОК:\n%s\n\n" % script.hook)
+        w("📖 ВВЕДЕНИЕ:\n%s\n\n" % script.intro)
 
         for i, section in enumerate(script.sections, 1):
             if isinstance(section, dict):
-                lines.append(f"📌 {i}. {section.get('title', 'Раздел')}")
-                lines.append(section.get("content", ""))
-                lines.append("")
+                w("📌 %d. %s\n" % (i, section.get("title", "Раздел")))
+                w(section.get("content", ""))
+                w("\n\n")
 
-        lines.extend([
-            f"🎯 CTA:\n{script.cta}",
-            "",
-            f"👋 ЗАВЕРШЕНИЕ:\n{script.outro}",
-        ])
+        w("🎯 CTA:\n%s\n\n" % script.cta)
+        w("👋 ЗАВЕРШЕНИЕ:\n%s" % script.outro)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def format_script_for_teleprompter(self, script: GeneratedScript) -> str:
         """Format script for teleprompter/reading.
@@ -0,0 +1,113 @@
+"""Shared LLM SDK clients backed by one HTTP connection pool."""
+
+import asyncio
+import random
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import anthropic
+import httpx
+import openai
+import structlog
+
+
+logger = structlog.get_logger()
+
+
+# Every SDK client normally brings its own httpx pool, so the extractor,
+# analyzer and writer would each pay their own TLS handshake and keep
+# separate keep-alive connections to the same API host. One shared
+# AsyncClient lets concurrent requests multiplex over the same
+# connections (HTTP/2) instead.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+@lru_cache(maxsize=2)
+def get_llm_client(
+    provider: str,
+    api_key: str,
+) -> Union[anthropic.AsyncAnthropic, openai.AsyncOpenAI]:
+    """Shared async LLM client per (provider, key)."""
+    if provider == "anthropic":
+        return anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=_get_http_client()
+        )
+    return openai.AsyncOpenAI(api_key=api_key, http_client=_get_http_client())
+
+
+# One gate for every LLM request in the process. The per-video semaphore
+# in the monitoring cycle bounds videos, but a single video can issue
+# several LLM calls at once; without a shared cap a burst of 429s
+# collapses the fan-out to sequential re-runs.
+_MAX_CONCURRENT_REQUESTS = 8
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+_RATE_LIMIT_ERRORS = (anthropic.RateLimitError, openai.RateLimitError)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the shared request gate, created lazily on the running loop."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return _llm_semaphore
+
+
+async def call_with_retry(
+    call: Callable[..., Awaitable[Any]],
+    *args: Any,
+    attempts: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> Any:
+    """Run an LLM call under the shared gate, retrying rate limits.
+
+    Backoff is exponential with full jitter so concurrent callers hit by
+    the same 429 do not retry in lockstep. Non-rate-limit errors
+    propagate immediately.
+
+    Args:
+        call: Coroutine function performing one SDK request.
+        *args: Arguments forwarded to ``call``.
+        attempts: Total tries before the last error is re-raised.
+        base_delay: First backoff delay in seconds.
+        max_delay: Backoff ceiling in seconds.
+
+    Returns:
+        Whatever ``call`` returns.
+    """
+    async with _get_semaphore():
+        for attempt in range(attempts):
+            try:
+                return await call(*args)
+            except _RATE_LIMIT_ERRORS:
+                if attempt == attempts - 1:
+                    raise
+                delay = min(max_delay, base_delay * 2**attempt)
+                delay *= 0.5 + random.random()
+                logger.warning(
+                    "llm_rate_limited",
+                    attempt=attempt + 1,
+                    retry_in=round(delay, 1),
+                )
+                await asyncio.sleep(delay)
+
+
+async def close_llm_clients() -> None:
+    """Close the shared HTTP pool (at application shutdown)."""
+    global _http_client
+    get_llm_client.cache_clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,8 +1,11 @@
 """Main entry point for YouTube DeFi Monitor."""
 
 import asyncio
+import sys
+
+import orjson
 import structlog
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -13,17 +16,30 @@ from .monitor.youtube_client import YouTubeClient
 from .monitor.virality_checker import ViralityChecker
 from .transcript.extractor import TranscriptExtractor
 from .factcheck.verifier import FactVerifier
-from .generator.analyzer import StructureAnalyzer
+from .generator.analyzer import StructureAnalyzer, VideoStructure
+from .generator.llm_cache import LLMCache
 from .generator.script_writer import ScriptWriter
+from .llm import close_llm_clients
 from .notify.telegram_bot import TelegramNotifier
 
 
-# Configure logging
+# Configure logging. Interactive runs keep the pretty console renderer;
+# deployed runs (Railway/Docker pipe stdout) emit JSON serialized by
+# orjson, which keeps the high-volume verification logging off the
+# stdlib json hot path.
+_log_renderer = (
+    structlog.dev.ConsoleRenderer()
+    if sys.stdout.isatty()
+    else structlog.processors.JSONRenderer(
+        serializer=lambda obj, **kw: orjson.dumps(obj, default=str).decode()
+    )
+)
+
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.dev.ConsoleRenderer(),
+        _log_renderer,
     ],
 )
 logger = structlog.get_logger()
@@ -41,8 +57,9 @@ class YouTubeMonitor:
         self.virality_checker = ViralityChecker()
         self.transcript_extractor = TranscriptExtractor()
         self.fact_verifier = FactVerifier()
-        self.structure_analyzer = StructureAnalyzer()
-        self.script_writer = ScriptWriter()
+        self.llm_cache = LLMCache()
+        self.structure_analyzer = StructureAnalyzer(cache=self.llm_cache)
+        self.script_writer = ScriptWriter(cache=self.llm_cache)
         self.telegram = TelegramNotifier(self.db)
 
         # Scheduler
@@ -51,7 +68,11 @@ class YouTubeMonitor:
     async def initialize(self) -> None:
         """Initialize all services."""
         await self.db.connect()
-        await self.telegram.initialize()
+        await self.llm_cache.connect()
+
+        # Seed the client's seen-ID set so the first cycle after a
+        # restart does not re-fetch details for videos already decided
+        self.youtube.prime_seen_ids(await self.db.get_all_video_ids())
 
         # Initialize channels in database
         for channel_config in self.config.channels:
@@ -65,7 +86,11 @@ class YouTubeMonitor:
     async def shutdown(self) -> None:
         """Shutdown all services."""
         self.scheduler.shutdown()
+        await self.youtube.aclose()
         await self.telegram.shutdown()
+        await self.fact_verifier.close()
+        await close_llm_clients()
+        await self.llm_cache.close()
         await self.db.close()
         logger.info("monitor_shutdown")
 
@@ -84,16 +109,53 @@ class YouTubeMonitor:
             # Notify about viral videos
             await self.telegram.notify_viral_videos(viral_videos)
 
-            # 2. Process each viral video
-            scripts_generated = 0
+            # 2. Process viral videos concurrently; each one is a chain of
+            # network waits (transcript, LLM calls, fact APIs), so
+            # overlapping them collapses wall time. The semaphore caps how
+            # many videos are in flight at once.
+            to_process = []
             for video in viral_videos:
                 # Skip if we already have a script for this video
                 if await self.db.script_exists_for_video(video.id):
                     logger.info("script_already_exists", video_id=video.id)
                     continue
+                to_process.append(video)
+
+            # Optionally pre-compute all structures in one batch-API
+            # submission; _process_video then skips its per-video
+            # analysis for the videos the batch covered.
+            structures: dict[str, VideoStructure] = {}
+            if self.config.llm.use_batch_analysis and to_process:
+                transcripts = await self.transcript_extractor.get_transcripts(
+                    [video.id for video in to_process]
+                )
+                if transcripts:
+                    structures = await self.structure_analyzer.analyze_batch(
+                        list(transcripts.values())
+                    )
+
+            sem = asyncio.Semaphore(self.config.monitoring.max_concurrent)
+
+            async def _bounded_process(video: Video) -> Script | None:
+                async with sem:
+                    return await self._process_video(
+                        video, structure=structures.get(video.id)
+                    )
+
+            results = await asyncio.gather(
+                *(_bounded_process(v) for v in to_process),
+                return_exceptions=True,
+            )
 
-                script = await self._process_video(video)
-                if script:
+            scripts_generated = 0
+            for video, result in zip(to_process, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "video_processing_error",
+                        video_id=video.id,
+                        error=str(result),
+                    )
+                elif result:
                     scripts_generated += 1
 
             # 3. Send daily summary
@@ -120,6 +182,8 @@ class YouTubeMonitor:
             List of viral videos.
         """
         all_viral = []
+        ttl = timedelta(hours=self.config.monitoring.channel_ttl_hours)
+        now = datetime.utcnow()
 
         for channel_config in self.config.channels:
             # Get channel from database
@@ -127,12 +191,16 @@ class YouTubeMonitor:
             if not channel:
                 continue
 
-            # Update channel info
-            updated_channel = await self.youtube.get_channel_info(channel_config.id)
-            if updated_channel:
-                updated_channel.name = channel_config.name
-                await self.db.upsert_channel(updated_channel)
-                channel = updated_channel
+            # Channel metadata moves at human timescales; only hit the
+            # YouTube API once the stored row is older than the TTL
+            if channel.last_checked is None or now - channel.last_checked >= ttl:
+                updated_channel = await self.youtube.get_channel_info(
+                    channel_config.id
+                )
+                if updated_channel:
+                    updated_channel.name = channel_config.name
+                    await self.db.upsert_channel(updated_channel)
+                    channel = updated_channel
 
             # Get recent videos
             videos = await self.youtube.get_recent_videos(
@@ -151,11 +219,17 @@ class YouTubeMonitor:
 
         return all_viral
 
-    async def _process_video(self, video: Video) -> Script | None:
+    async def _process_video(
+        self,
+        video: Video,
+        structure: VideoStructure | None = None,
+    ) -> Script | None:
         """Process a viral video: extract transcript, verify facts, generate script.
 
         Args:
             video: Video to process.
+            structure: Pre-computed structure (from batch analysis); when
+                given, the per-video analysis call is skipped.
 
         Returns:
             Generated Script or None.
@@ -168,29 +242,26 @@ class YouTubeMonitor:
             logger.warning("no_transcript", video_id=video.id)
             return None
 
-        # Update video with transcript
-        structure = self.transcript_extractor.extract_structure(transcript)
+        # Update video with transcript (the timing-based section dict,
+        # distinct from the LLM-derived structure parameter)
+        transcript_structure = self.transcript_extractor.extract_structure(
+            transcript
+        )
         await self.db.update_video_transcript(
             video.id,
             transcript.full_text,
-            structure,
+            transcript_structure,
         )
 
-        # 2. Analyze video structure
-        video_structure = await self.structure_analyzer.analyze(transcript)
-        if not video_structure:
-            logger.warning("structure_analysis_failed", video_id=video.id)
-            return None
-
-        # 3. Verify facts
+        # 2. Verify facts — they feed straight into the fused
+        # analysis + generation call below
         verified_facts = await self.fact_verifier.verify_claims(
             transcript.full_text,
             video.id,
         )
 
-        # Save facts to database
-        for fact in verified_facts:
-            await self.db.insert_fact(fact)
+        # Save facts to database in one statement/transaction
+        await self.db.insert_facts_bulk(verified_facts)
 
         # Get only verified facts for script generation
         verified_only = self.fact_verifier.get_only_verified(verified_facts)
@@ -202,18 +273,51 @@ class YouTubeMonitor:
             verified=len(verified_only),
         )
 
-        # 4. Generate script
-        generated = await self.script_writer.generate_script(
-            topic=video.title,
-            structure=video_structure,
-            verified_facts=verified_only,
-            target_duration=video_structure.estimated_duration_minutes,
-        )
-
-        if not generated:
-            logger.warning("script_generation_failed", video_id=video.id)
+        # Without verified facts the prompt degrades to "use common
+        # knowledge" — not worth a full generation call
+        if not verified_only:
+            logger.info("skipping_script_no_facts", video_id=video.id)
             return None
 
+        # 3. Generate the script. With a pre-computed structure (batch
+        # analysis) only the writing call remains; otherwise analyze and
+        # generate in one fused LLM round trip, falling back to the
+        # two-step path if the combined response fails to parse
+        if structure is not None:
+            generated = await self.script_writer.generate_script(
+                topic=video.title,
+                structure=structure,
+                verified_facts=verified_only,
+                target_duration=structure.estimated_duration_minutes,
+            )
+
+            if not generated:
+                logger.warning("script_generation_failed", video_id=video.id)
+                return None
+        else:
+            video_structure, generated = await self.script_writer.analyze_and_generate(
+                transcript,
+                topic=video.title,
+                verified_facts=verified_only,
+            )
+
+            if not generated:
+                video_structure = await self.structure_analyzer.analyze(transcript)
+                if not video_structure:
+                    logger.warning("structure_analysis_failed", video_id=video.id)
+                    return None
+
+                generated = await self.script_writer.generate_script(
+                    topic=video.title,
+                    structure=video_structure,
+                    verified_facts=verified_only,
+                    target_duration=video_structure.estimated_duration_minutes,
+                )
+
+                if not generated:
+                    logger.warning("script_generation_failed", video_id=video.id)
+                    return None
+
         # Save script
         script = Script(
             source_video_id=video.id,
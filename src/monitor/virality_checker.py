@@ -1,8 +1,8 @@
 """Virality checker with adaptive thresholds based on channel size."""
 
 import structlog
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
 from ..config import get_config, ViralityThresholds
@@ -12,7 +12,14 @@ from ..database.models import Video, Channel
 logger = structlog.get_logger()
 
 
-@dataclass
+_CATEGORY_EMOJI: dict[str, str] = {
+    "small": "🏠",
+    "medium": "🏢",
+    "large": "🏰",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ViralityResult:
     """Result of virality check."""
     is_viral: bool
@@ -40,6 +47,27 @@ class ViralityChecker:
         """
         self.thresholds = thresholds or get_config().monitoring.virality_thresholds
 
+        # Sorted bucket boundaries for bisect instead of a branch cascade
+        # per lookup. _bucket_limits holds the inclusive upper bound of
+        # each bounded category; the open-ended "large" bucket is the
+        # fallthrough past the end.
+        self._bucket_limits = (
+            self.thresholds.small.max_subs,
+            self.thresholds.medium.max_subs,
+        )
+        self._buckets = (
+            ("small", self.thresholds.small.ratio),
+            ("medium", self.thresholds.medium.ratio),
+            ("large", self.thresholds.large.ratio),
+        )
+        self._ratio_by_category = {
+            category: ratio for category, ratio in self._buckets
+        }
+
+    def _lookup_bucket(self, subscribers: int) -> tuple[str, float]:
+        """Resolve (category, threshold ratio) for a subscriber count."""
+        return self._buckets[bisect_left(self._bucket_limits, subscribers)]
+
     def get_channel_category(self, subscribers: int) -> str:
         """Determine channel category based on subscriber count.
 
@@ -49,12 +77,7 @@ class ViralityChecker:
         Returns:
             Category name: "small", "medium", or "large".
         """
-        if subscribers <= self.thresholds.small.max_subs:
-            return "small"
-        elif subscribers <= self.thresholds.medium.max_subs:
-            return "medium"
-        else:
-            return "large"
+        return self._lookup_bucket(subscribers)[0]
 
     def get_threshold_ratio(self, category: str) -> float:
         """Get the virality threshold ratio for a category.
@@ -65,12 +88,28 @@ class ViralityChecker:
         Returns:
             Threshold ratio (views/subs required for virality).
         """
-        if category == "small":
-            return self.thresholds.small.ratio
-        elif category == "medium":
-            return self.thresholds.medium.ratio
-        else:
-            return self.thresholds.large.ratio
+        return self._ratio_by_category.get(category, self.thresholds.large.ratio)
+
+    def _viral_core(
+        self,
+        views: int,
+        subscribers: int,
+    ) -> tuple[bool, float, float, str]:
+        """Virality decision as a plain tuple, no dataclass allocation.
+
+        Returns:
+            (is_viral, score, threshold_ratio, category).
+        """
+        # Avoid division by zero
+        if subscribers <= 0:
+            return False, 0.0, 0.0, "unknown"
+
+        category, threshold_ratio = self._lookup_bucket(subscribers)
+
+        # Calculate virality score (views / subscribers)
+        score = views / subscribers
+
+        return score >= threshold_ratio, round(score, 3), threshold_ratio, category
 
     def check_virality(
         self,
@@ -79,6 +118,9 @@ class ViralityChecker:
     ) -> ViralityResult:
         """Check if a video is viral based on views and subscriber count.
 
+        Thin wrapper over _viral_core for callers that want the full
+        report object.
+
         Args:
             views: Video view count.
             subscribers: Channel subscriber count.
@@ -86,29 +128,13 @@ class ViralityChecker:
         Returns:
             ViralityResult with all details.
         """
-        # Avoid division by zero
-        if subscribers <= 0:
-            return ViralityResult(
-                is_viral=False,
-                score=0.0,
-                threshold_used=0.0,
-                channel_category="unknown",
-                views=views,
-                subscribers=subscribers,
-            )
-
-        category = self.get_channel_category(subscribers)
-        threshold_ratio = self.get_threshold_ratio(category)
-
-        # Calculate virality score (views / subscribers)
-        score = views / subscribers
-
-        # Check if viral
-        is_viral = score >= threshold_ratio
+        is_viral, score, threshold_ratio, category = self._viral_core(
+            views, subscribers
+        )
 
         return ViralityResult(
             is_viral=is_viral,
-            score=round(score, 3),
+            score=score,
             threshold_used=threshold_ratio,
             channel_category=category,
             views=views,
@@ -131,36 +157,43 @@ class ViralityChecker:
         """
         viral_videos = []
 
+        subscribers = channel.subscribers
+        if subscribers <= 0:
+            return viral_videos
+
+        # The channel is fixed for the whole list, so resolve the bucket
+        # once and reject non-viral videos (the vast majority) with a
+        # single comparison — no ViralityResult churn for them.
+        category, threshold_ratio = self._lookup_bucket(subscribers)
+        min_views = subscribers * threshold_ratio
+
         for video_data in videos:
-            result = self.check_virality(
-                views=video_data["views"],
-                subscribers=channel.subscribers,
+            views = video_data["views"]
+            if views < min_views:
+                continue
+
+            score = round(views / subscribers, 3)
+            video = Video(
+                id=video_data["id"],
+                channel_id=channel.id,
+                title=video_data["title"],
+                views=views,
+                published_at=video_data["published_at"],
+                virality_score=score,
             )
 
-            if result.is_viral:
-                video = Video(
-                    id=video_data["id"],
-                    channel_id=channel.id,
-                    title=video_data["title"],
-                    views=video_data["views"],
-                    published_at=datetime.fromisoformat(
-                        video_data["published_at"].replace("Z", "+00:00")
-                    ),
-                    virality_score=result.score,
-                )
-
-                viral_videos.append(video)
-
-                logger.info(
-                    "viral_video_found",
-                    video_id=video.id,
-                    title=video.title[:50],
-                    views=result.views,
-                    subscribers=result.subscribers,
-                    score=result.score,
-                    threshold=result.threshold_used,
-                    category=result.channel_category,
-                )
+            viral_videos.append(video)
+
+            logger.info(
+                "viral_video_found",
+                video_id=video.id,
+                title=video.title[:50],
+                views=views,
+                subscribers=subscribers,
+                score=score,
+                threshold=threshold_ratio,
+                category=category,
+            )
 
         return viral_videos
 
@@ -174,11 +207,7 @@ class ViralityChecker:
             Formatted string report.
         """
         status = "VIRAL" if result.is_viral else "Normal"
-        category_emoji = {
-            "small": "🏠",
-            "medium": "🏢",
-            "large": "🏰",
-        }.get(result.channel_category, "❓")
+        category_emoji = _CATEGORY_EMOJI.get(result.channel_category, "❓")
 
         return (
             f"{status} | Score: {result.score:.2f}x "
@@ -1,11 +1,12 @@
 """YouTube Data API client for monitoring channels."""
 
+import asyncio
+
+import aiohttp
 import structlog
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
-
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from typing import Iterable, Optional
 
 from ..config import get_config, ChannelConfig
 from ..database.models import Channel, Video
@@ -14,8 +15,44 @@ from ..database.models import Channel, Video
 logger = structlog.get_logger()
 
 
+_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# Transient statuses worth one more try before giving up.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# How long a cached channel answer is served without even a conditional
+# revalidation round trip.
+_CHANNEL_CACHE_TTL = timedelta(hours=6)
+
+# Cap on the recently-seen video-ID LRU.
+_SEEN_IDS_MAX = 10_000
+
+
+def _published_after_cutoff(max_age_days: int) -> str:
+    """Format the search.list publishedAfter cutoff for an age window."""
+    return (datetime.utcnow() - timedelta(days=max_age_days)).isoformat() + "Z"
+
+
+def _parse_yt_ts(value: str) -> datetime:
+    """Parse a YouTube RFC 3339 timestamp ("2024-01-01T08:00:00Z").
+
+    Parsed once here at the API boundary so downstream consumers get a
+    datetime instead of each re-doing the replace("Z", ...) + fromisoformat
+    dance on the same string.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 class YouTubeClient:
-    """Client for YouTube Data API v3."""
+    """Client for YouTube Data API v3.
+
+    Talks to the REST endpoint directly through aiohttp: the
+    googleapiclient transport is synchronous and blocked the event loop
+    for the full request latency, which serialized the monitor_channels
+    fan-out.
+    """
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize YouTube client.
@@ -27,109 +64,291 @@ class YouTubeClient:
         if not self.api_key:
             raise ValueError("YouTube API key is required")
 
-        self._youtube = build("youtube", "v3", developerKey=self.api_key)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # (Channel, etag, fetched_at) per channel. Within the TTL the
+        # cached object is returned outright; after it, the stored ETag
+        # turns the refresh into a cheap 304 when nothing changed.
+        self._channel_cache: dict[str, tuple[Channel, str, datetime]] = {}
+
+        # LRU set of video IDs whose details were already fetched.
+        # Monitoring cycles overlap heavily (the search window is days
+        # wide, the cadence daily), so most search hits repeat; filtering
+        # on this set keeps repeats out of the videos.list batches.
+        self._seen_ids: OrderedDict[str, None] = OrderedDict()
+
+    def prime_seen_ids(self, video_ids: Iterable[str]) -> None:
+        """Pre-populate the seen-ID set, e.g. from the database at startup."""
+        for video_id in video_ids:
+            self._mark_seen(video_id)
+
+    def _mark_seen(self, video_id: str) -> None:
+        """Record a video ID as seen, evicting the oldest past the cap."""
+        self._seen_ids[video_id] = None
+        self._seen_ids.move_to_end(video_id)
+        if len(self._seen_ids) > _SEEN_IDS_MAX:
+            self._seen_ids.popitem(last=False)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on first use.
+
+        Lazy so the client can be constructed before the event loop
+        starts; the pooled connector is then reused for every request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
-    async def get_channel_info(self, channel_id: str) -> Optional[Channel]:
+    async def _get_json(
+        self,
+        resource: str,
+        params: dict,
+        headers: Optional[dict] = None,
+    ) -> Optional[dict]:
+        """GET one API resource, retrying transient 429/5xx responses.
+
+        Returns None on 304 Not Modified (only possible when the caller
+        sent an If-None-Match header).
+        """
+        session = await self._ensure_session()
+        params = {**params, "key": self.api_key}
+        url = f"{_BASE_URL}/{resource}"
+
+        for attempt in range(3):
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status == 304:
+                    return None
+                if response.status in _RETRY_STATUSES and attempt < 2:
+                    await asyncio.sleep(0.5 * 2**attempt)
+                    continue
+                response.raise_for_status()
+                return await response.json()
+
+    async def get_channel_info(
+        self,
+        channel_id: str,
+        ttl: timedelta = _CHANNEL_CACHE_TTL,
+    ) -> Optional[Channel]:
         """Get channel information including subscriber count.
 
         Args:
             channel_id: YouTube channel ID (starts with UC).
+            ttl: How long a cached answer is served without any request.
+                Subscriber counts move at day timescales, so the cheapest
+                get_channel_info is no call at all.
 
         Returns:
             Channel object or None if not found.
         """
+        cached = self._channel_cache.get(channel_id)
+        now = datetime.utcnow()
+
+        if cached and now - cached[2] < ttl:
+            channel = cached[0]
+            channel.last_checked = now
+            return channel
+
+        headers = None
+        if cached and cached[1]:
+            headers = {"If-None-Match": cached[1]}
+
         try:
-            response = self._youtube.channels().list(
-                part="snippet,statistics",
-                id=channel_id,
-            ).execute()
+            response = await self._get_json(
+                "channels",
+                {
+                    "part": "snippet,statistics",
+                    "id": channel_id,
+                    # Partial response: only the fields actually consumed
+                    "fields": "etag,items(id,snippet/title,statistics/subscriberCount)",
+                },
+                headers=headers,
+            )
 
-            if not response.get("items"):
+            if response is None and cached:
+                # 304: unchanged upstream, restart the TTL on the cached
+                # object
+                channel, etag, _ = cached
+                channel.last_checked = now
+                self._channel_cache[channel_id] = (channel, etag, now)
+                return channel
+
+            if not response or not response.get("items"):
                 logger.warning("channel_not_found", channel_id=channel_id)
                 return None
 
             item = response["items"][0]
-            return Channel(
+            channel = Channel(
                 id=channel_id,
                 name=item["snippet"]["title"],
                 subscribers=int(item["statistics"].get("subscriberCount", 0)),
-                last_checked=datetime.utcnow(),
+                last_checked=now,
+            )
+            self._channel_cache[channel_id] = (
+                channel,
+                response.get("etag", ""),
+                now,
             )
+            return channel
 
-        except HttpError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error("youtube_api_error", error=str(e), channel_id=channel_id)
             return None
 
-    async def get_recent_videos(
+    async def _search_video_ids(
         self,
         channel_id: str,
         max_age_days: int = 7,
         max_results: int = 50,
-    ) -> list[dict]:
-        """Get recent videos from a channel.
+        published_after: Optional[str] = None,
+    ) -> list[str]:
+        """Search one channel's recent video IDs.
 
         Args:
             channel_id: YouTube channel ID.
             max_age_days: Maximum age of videos in days.
             max_results: Maximum number of results.
+            published_after: Pre-formatted RFC 3339 cutoff; callers
+                fanning out over many channels compute it once instead of
+                per call. Derived from max_age_days when omitted.
 
         Returns:
-            List of video data dictionaries.
+            List of video IDs, newest first.
         """
         try:
-            # Calculate date threshold
-            published_after = (
-                datetime.utcnow() - timedelta(days=max_age_days)
-            ).isoformat() + "Z"
-
-            # Search for videos
-            search_response = self._youtube.search().list(
-                part="id",
-                channelId=channel_id,
-                type="video",
-                order="date",
-                publishedAfter=published_after,
-                maxResults=max_results,
-            ).execute()
-
-            video_ids = [
+            if published_after is None:
+                published_after = _published_after_cutoff(max_age_days)
+
+            search_response = await self._get_json(
+                "search",
+                {
+                    "part": "id",
+                    "channelId": channel_id,
+                    "type": "video",
+                    "order": "date",
+                    "publishedAfter": published_after,
+                    "maxResults": str(max_results),
+                    "fields": "items(id/videoId)",
+                },
+            )
+            return [
                 item["id"]["videoId"]
                 for item in search_response.get("items", [])
             ]
 
-            if not video_ids:
-                return []
-
-            # Get video details
-            videos_response = self._youtube.videos().list(
-                part="snippet,statistics",
-                id=",".join(video_ids),
-            ).execute()
-
-            videos = []
-            for item in videos_response.get("items", []):
-                videos.append({
-                    "id": item["id"],
-                    "title": item["snippet"]["title"],
-                    "description": item["snippet"]["description"],
-                    "published_at": item["snippet"]["publishedAt"],
-                    "channel_id": item["snippet"]["channelId"],
-                    "views": int(item["statistics"].get("viewCount", 0)),
-                    "likes": int(item["statistics"].get("likeCount", 0)),
-                    "comments": int(item["statistics"].get("commentCount", 0)),
-                })
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("youtube_api_error", error=str(e), channel_id=channel_id)
+            return []
 
-            logger.info(
-                "fetched_videos",
-                channel_id=channel_id,
-                count=len(videos),
+    @staticmethod
+    def _parse_video_item(item: dict) -> dict:
+        """Map one videos.list item to the pipeline's video dict.
+
+        snippet/statistics are bound once instead of re-indexed per
+        field — halves the dict lookups on the hot parse path.
+        """
+        snippet = item["snippet"]
+        stats = item["statistics"]
+        return {
+            "id": item["id"],
+            "title": snippet["title"],
+            "description": snippet["description"],
+            "published_at": _parse_yt_ts(snippet["publishedAt"]),
+            "channel_id": snippet["channelId"],
+            "views": int(stats.get("viewCount", 0)),
+            "likes": int(stats.get("likeCount", 0)),
+            "comments": int(stats.get("commentCount", 0)),
+        }
+
+    async def _fetch_videos_by_ids(self, video_ids: list[str]) -> list[dict]:
+        """Fetch video details, one videos.list call per 50-ID chunk.
+
+        videos.list accepts up to 50 comma-separated IDs, so IDs
+        collected across channels can share requests instead of paying
+        one call per channel. IDs already in the seen set are skipped
+        outright — monitoring windows overlap heavily between cycles, so
+        most search hits were fetched (and decided) in an earlier cycle
+        or a previous run primed from the database.
+
+        Args:
+            video_ids: Video IDs to look up.
+
+        Returns:
+            List of video data dictionaries for the not-yet-seen IDs.
+        """
+        new_ids = [vid for vid in video_ids if vid not in self._seen_ids]
+        skipped = len(video_ids) - len(new_ids)
+        if skipped:
+            logger.info("seen_videos_skipped", count=skipped)
+
+        videos: list[dict] = []
+
+        for start in range(0, len(new_ids), 50):
+            chunk = new_ids[start : start + 50]
+            try:
+                response = await self._get_json(
+                    "videos",
+                    {
+                        "part": "snippet,statistics",
+                        "id": ",".join(chunk),
+                        "fields": (
+                            "items(id,"
+                            "snippet(title,description,publishedAt,channelId),"
+                            "statistics(viewCount,likeCount,commentCount))"
+                        ),
+                    },
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error("youtube_api_error", error=str(e))
+                continue
+
+            videos.extend(
+                self._parse_video_item(item)
+                for item in response.get("items", [])
             )
-            return videos
 
-        except HttpError as e:
-            logger.error("youtube_api_error", error=str(e), channel_id=channel_id)
+        for video in videos:
+            self._mark_seen(video["id"])
+
+        return videos
+
+    async def get_recent_videos(
+        self,
+        channel_id: str,
+        max_age_days: int = 7,
+        max_results: int = 50,
+    ) -> list[dict]:
+        """Get recent videos from a channel.
+
+        Videos already decided in an earlier cycle (or primed from the
+        database at startup) are filtered out by the seen set before any
+        videos.list call is issued.
+
+        Args:
+            channel_id: YouTube channel ID.
+            max_age_days: Maximum age of videos in days.
+            max_results: Maximum number of results.
+
+        Returns:
+            List of video data dictionaries, not-yet-seen only.
+        """
+        video_ids = await self._search_video_ids(
+            channel_id, max_age_days=max_age_days, max_results=max_results
+        )
+        if not video_ids:
             return []
 
+        videos = await self._fetch_videos_by_ids(video_ids)
+        logger.info("fetched_videos", channel_id=channel_id, count=len(videos))
+        return videos
+
     async def get_video_details(self, video_id: str) -> Optional[dict]:
         """Get detailed information about a specific video.
 
@@ -140,30 +359,42 @@ class YouTubeClient:
             Video data dictionary or None.
         """
         try:
-            response = self._youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=video_id,
-            ).execute()
+            response = await self._get_json(
+                "videos",
+                {
+                    "part": "snippet,statistics,contentDetails",
+                    "id": video_id,
+                    "fields": (
+                        "items(id,"
+                        "snippet(title,description,publishedAt,channelId,"
+                        "channelTitle,tags),"
+                        "statistics(viewCount,likeCount,commentCount),"
+                        "contentDetails/duration)"
+                    ),
+                },
+            )
 
             if not response.get("items"):
                 return None
 
             item = response["items"][0]
+            snippet = item["snippet"]
+            stats = item["statistics"]
             return {
                 "id": item["id"],
-                "title": item["snippet"]["title"],
-                "description": item["snippet"]["description"],
-                "published_at": item["snippet"]["publishedAt"],
-                "channel_id": item["snippet"]["channelId"],
-                "channel_title": item["snippet"]["channelTitle"],
-                "views": int(item["statistics"].get("viewCount", 0)),
-                "likes": int(item["statistics"].get("likeCount", 0)),
-                "comments": int(item["statistics"].get("commentCount", 0)),
+                "title": snippet["title"],
+                "description": snippet["description"],
+                "published_at": _parse_yt_ts(snippet["publishedAt"]),
+                "channel_id": snippet["channelId"],
+                "channel_title": snippet["channelTitle"],
+                "views": int(stats.get("viewCount", 0)),
+                "likes": int(stats.get("likeCount", 0)),
+                "comments": int(stats.get("commentCount", 0)),
                 "duration": item["contentDetails"]["duration"],
-                "tags": item["snippet"].get("tags", []),
+                "tags": snippet.get("tags", []),
             }
 
-        except HttpError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error("youtube_api_error", error=str(e), video_id=video_id)
             return None
 
@@ -171,39 +402,98 @@ class YouTubeClient:
         self,
         channels: list[ChannelConfig],
         max_video_age_days: int = 7,
+        concurrency: int = 8,
+        channel_info_ttl: timedelta = _CHANNEL_CACHE_TTL,
     ) -> tuple[list[Channel], list[dict]]:
         """Monitor multiple channels and collect their videos.
 
+        The per-channel calls are network waits, so they are fanned out
+        with gather in two phases (channel info, then videos) instead of
+        paying 2N sequential round trips. The semaphore bounds how many
+        API requests are in flight at once.
+
         Args:
             channels: List of channel configurations.
             max_video_age_days: Maximum age of videos to fetch.
+            concurrency: Maximum concurrent API calls.
+            channel_info_ttl: Freshness window within which cached channel
+                metadata is used without any channels.list call; the video
+                searches are still issued every cycle.
 
         Returns:
             Tuple of (updated channels, all videos).
         """
-        updated_channels = []
-        all_videos = []
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _bounded(coro):
+            async with sem:
+                return await coro
 
-        for channel_config in channels:
-            # Get channel info
-            channel = await self.get_channel_info(channel_config.id)
+        infos = await asyncio.gather(
+            *(
+                _bounded(self.get_channel_info(c.id, ttl=channel_info_ttl))
+                for c in channels
+            ),
+            return_exceptions=True,
+        )
+
+        updated_channels = []
+        monitored: list[tuple[ChannelConfig, Channel]] = []
+        for channel_config, channel in zip(channels, infos):
+            if isinstance(channel, BaseException):
+                logger.error(
+                    "channel_monitor_error",
+                    channel_id=channel_config.id,
+                    error=str(channel),
+                )
+                continue
             if channel:
                 channel.name = channel_config.name  # Use configured name
                 updated_channels.append(channel)
-
-                # Get recent videos
-                videos = await self.get_recent_videos(
-                    channel_config.id,
-                    max_age_days=max_video_age_days,
+                monitored.append((channel_config, channel))
+
+        # One cutoff timestamp for the whole fan-out; per-call computation
+        # would also drift slightly between channels.
+        published_after = _published_after_cutoff(max_video_age_days)
+
+        id_lists = await asyncio.gather(
+            *(
+                _bounded(
+                    self._search_video_ids(
+                        channel_config.id, published_after=published_after
+                    )
                 )
-                all_videos.extend(videos)
-
-                logger.info(
-                    "monitored_channel",
+                for channel_config, _ in monitored
+            ),
+            return_exceptions=True,
+        )
+
+        # Flatten IDs across channels (dict preserves order and dedups)
+        # so details come back in ceil(total/50) videos.list calls
+        # instead of one per channel.
+        all_ids: dict[str, None] = {}
+        for (channel_config, _), ids in zip(monitored, id_lists):
+            if isinstance(ids, BaseException):
+                logger.error(
+                    "channel_monitor_error",
                     channel_id=channel_config.id,
-                    name=channel_config.name,
-                    subscribers=channel.subscribers,
-                    videos_found=len(videos),
+                    error=str(ids),
                 )
+                continue
+            all_ids.update(dict.fromkeys(ids))
+
+        # _fetch_videos_by_ids drops IDs already in the seen set, so only
+        # the delta over previous cycles costs videos.list quota.
+        all_videos = await self._fetch_videos_by_ids(list(all_ids))
+
+        counts = Counter(video["channel_id"] for video in all_videos)
+        for channel_config, channel in monitored:
+            logger.info(
+                "monitored_channel",
+                channel_id=channel_config.id,
+                name=channel_config.name,
+                subscribers=channel.subscribers,
+                videos_found=counts.get(channel_config.id, 0),
+            )
 
         return updated_channels, all_videos
@@ -1,9 +1,11 @@
 """Telegram bot for notifications and script management."""
 
+import asyncio
+
 import structlog
 from typing import Optional
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -18,6 +20,34 @@ from ..database.models import Database, Script, ScriptStatus, Video
 logger = structlog.get_logger()
 
 
+# Static button labels for the script-approval keyboard; only the
+# callback_data varies per script.
+_LBL_APPROVE = "✅ Одобрить"
+_LBL_REJECT = "❌ Отклонить"
+_LBL_REGEN = "🔄 Переделать"
+
+
+def _build_script_keyboard(script_id: int) -> InlineKeyboardMarkup:
+    """Build the approve/reject/regenerate keyboard for a script."""
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    _LBL_APPROVE, callback_data=f"approve_{script_id}"
+                ),
+                InlineKeyboardButton(
+                    _LBL_REJECT, callback_data=f"reject_{script_id}"
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    _LBL_REGEN, callback_data=f"regen_{script_id}"
+                ),
+            ],
+        ]
+    )
+
+
 class TelegramNotifier:
     """Telegram bot for sending notifications and managing scripts."""
 
@@ -36,6 +66,7 @@ class TelegramNotifier:
             raise ValueError("Telegram bot token is required")
 
         self.application: Optional[Application] = None
+        self._bot: Optional[Bot] = None
 
     async def initialize(self) -> None:
         """Initialize the bot application."""
@@ -66,6 +97,25 @@ class TelegramNotifier:
         """Shutdown the bot."""
         if self.application:
             await self.application.shutdown()
+        if self._bot is not None:
+            await self._bot.shutdown()
+            self._bot = None
+
+    async def _ensure_bot(self) -> Bot:
+        """Return a Bot for one-shot sends, building it lazily.
+
+        The notification paths only need a raw Bot; spinning up the full
+        Application with its handler set per send was pure overhead.
+        Handlers are only registered when start_polling actually needs
+        them. The Bot keeps one internal HTTP client, so connections to
+        api.telegram.org are reused across sends.
+        """
+        if self.application is not None:
+            return self.application.bot
+        if self._bot is None:
+            self._bot = Bot(self.bot_token)
+            await self._bot.initialize()
+        return self._bot
 
     # === Notification Methods ===
 
@@ -76,11 +126,10 @@ class TelegramNotifier:
             text: Message text.
             parse_mode: Parse mode (HTML or Markdown).
         """
-        if not self.application:
-            await self.initialize()
+        bot = await self._ensure_bot()
 
         try:
-            await self.application.bot.send_message(
+            await bot.send_message(
                 chat_id=self.chat_id,
                 text=text,
                 parse_mode=parse_mode,
@@ -97,10 +146,10 @@ class TelegramNotifier:
         if not videos:
             return
 
-        text = f"🔥 <b>Найдено {len(videos)} вирусных видео!</b>\n\n"
+        parts = [f"🔥 <b>Найдено {len(videos)} вирусных видео!</b>\n\n"]
 
         for i, video in enumerate(videos[:10], 1):  # Limit to 10
-            text += (
+            parts.append(
                 f"{i}. <b>{video.title[:50]}...</b>\n"
                 f"   👁 {video.views:,} просмотров | "
                 f"📈 {video.virality_score:.1f}x\n"
@@ -108,9 +157,9 @@ class TelegramNotifier:
             )
 
         if len(videos) > 10:
-            text += f"... и ещё {len(videos) - 10} видео"
+            parts.append(f"... и ещё {len(videos) - 10} видео")
 
-        await self.send_message(text)
+        await self.send_message("".join(parts))
 
     async def notify_new_script(self, script: Script, video: Video) -> None:
         """Send notification about a new generated script with approval buttons.
@@ -129,23 +178,12 @@ class TelegramNotifier:
             f"ID сценария: #{script.id}"
         )
 
-        # Create inline keyboard
-        keyboard = [
-            [
-                InlineKeyboardButton("✅ Одобрить", callback_data=f"approve_{script.id}"),
-                InlineKeyboardButton("❌ Отклонить", callback_data=f"reject_{script.id}"),
-            ],
-            [
-                InlineKeyboardButton("🔄 Переделать", callback_data=f"regen_{script.id}"),
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = _build_script_keyboard(script.id)
 
-        if not self.application:
-            await self.initialize()
+        bot = await self._ensure_bot()
 
         try:
-            await self.application.bot.send_message(
+            await bot.send_message(
                 chat_id=self.chat_id,
                 text=text,
                 parse_mode="HTML",
@@ -157,18 +195,34 @@ class TelegramNotifier:
     async def send_full_script(self, script: Script) -> None:
         """Send the full script text.
 
+        Long scripts go out as numbered chunks (Telegram caps messages
+        at 4096 chars) sent four at a time with gather; groups stay
+        sequential and each chunk carries its part number, so delivery
+        latency drops from N round trips to ~N/4 without losing the
+        reading order.
+
         Args:
             script: Script to send.
         """
-        # Split into chunks if too long (Telegram limit is 4096 chars)
         text = script.script_text
         chunk_size = 4000
 
-        for i in range(0, len(text), chunk_size):
-            chunk = text[i:i + chunk_size]
-            if i == 0:
-                chunk = f"📄 <b>Полный сценарий #{script.id}</b>\n\n" + chunk
-            await self.send_message(chunk)
+        chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        if not chunks:
+            return
+
+        total = len(chunks)
+        if total > 1:
+            chunks = [
+                "<i>(часть %d/%d)</i>\n%s" % (i, total, chunk)
+                for i, chunk in enumerate(chunks, 1)
+            ]
+        chunks[0] = f"📄 <b>Полный сценарий #{script.id}</b>\n\n" + chunks[0]
+
+        for start in range(0, total, 4):
+            await asyncio.gather(
+                *(self.send_message(chunk) for chunk in chunks[start:start + 4])
+            )
 
     async def notify_daily_summary(
         self,
@@ -211,9 +265,11 @@ class TelegramNotifier:
             await update.message.reply_text("❌ База данных не подключена")
             return
 
-        channels = await self.db.get_all_channels()
-        pending = await self.db.get_pending_scripts()
-        viral = await self.db.get_viral_videos(limit=5)
+        channels, pending, viral = await asyncio.gather(
+            self.db.get_all_channels(),
+            self.db.get_pending_scripts(),
+            self.db.get_viral_videos(limit=5),
+        )
 
         text = (
             f"📊 <b>Статус системы</b>\n\n"
@@ -236,12 +292,14 @@ class TelegramNotifier:
             await update.message.reply_text("Нет отслеживаемых каналов")
             return
 
-        text = "📺 <b>Отслеживаемые каналы:</b>\n\n"
+        parts = ["📺 <b>Отслеживаемые каналы:</b>\n\n"]
         for ch in channels:
             last = ch.last_checked.strftime("%d.%m %H:%M") if ch.last_checked else "никогда"
-            text += f"• <b>{ch.name}</b>\n  {ch.subscribers:,} подписчиков | Проверен: {last}\n\n"
+            parts.append(
+                f"• <b>{ch.name}</b>\n  {ch.subscribers:,} подписчиков | Проверен: {last}\n\n"
+            )
 
-        await update.message.reply_text(text, parse_mode="HTML")
+        await update.message.reply_text("".join(parts), parse_mode="HTML")
 
     async def _cmd_pending(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /pending command."""
@@ -255,12 +313,14 @@ class TelegramNotifier:
             await update.message.reply_text("✅ Нет сценариев, ожидающих одобрения")
             return
 
-        text = f"📝 <b>Ожидают одобрения ({len(pending)}):</b>\n\n"
+        parts = [f"📝 <b>Ожидают одобрения ({len(pending)}):</b>\n\n"]
         for script in pending[:10]:
             created = script.created_at.strftime("%d.%m %H:%M")
-            text += f"#{script.id} - {script.topic[:40]}...\n   Создан: {created}\n\n"
+            parts.append(
+                f"#{script.id} - {script.topic[:40]}...\n   Создан: {created}\n\n"
+            )
 
-        await update.message.reply_text(text, parse_mode="HTML")
+        await update.message.reply_text("".join(parts), parse_mode="HTML")
 
     async def _cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
@@ -1,10 +1,18 @@
 """YouTube transcript extraction and parsing."""
 
+import asyncio
+import pickle
 import re
+import time
+
 import structlog
-from dataclasses import dataclass
-from typing import Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
 
+from requests.exceptions import RequestException
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     NoTranscriptFound,
@@ -16,22 +24,266 @@ from youtube_transcript_api._errors import (
 logger = structlog.get_logger()
 
 
-@dataclass
+# On-disk transcript cache, one pickle per video next to the database.
+# Transcripts are immutable once published, so a week-long TTL mostly
+# guards against stale partial captions on very fresh videos. Fetching
+# one costs seconds of network; a cache hit is a sub-millisecond read.
+_TRANSCRIPT_CACHE_DIR = Path("data/.transcript_cache")
+_TRANSCRIPT_CACHE_TTL = 7 * 86400  # seconds
+
+
+# Compiled once at import; these run per segment / per transcript on the
+# extraction hot path.
+_BRACKETS_RE = re.compile(r"\[.*?\]")  # [Музыка], [Applause], ...
+_WS_RE = re.compile(r"\s+")
+# One alternation covering both punctuation fixups (space before
+# punctuation, missing space before a capital) so the combined text is
+# rewritten in a single pass instead of two full-copy re.sub calls.
+_PUNCT_FIX_RE = re.compile(r"\s+([.,!?])([A-ZА-Я])?|([.,!?])([A-ZА-Я])")
+# Word-boundary anchor drops most start positions; the lazy quantifier
+# keeps the prefix from re-trying every length 5..30 at each offset on
+# long transcripts.
+_NUMBER_PHRASE_RE = re.compile(
+    r"(?i)\b\w[\w\s]{3,28}?(?:\d+[%$]|\$\d+|\d+\s*(?:миллион|тысяч|процент|billion|million|thousand|percent))"
+)
+_CAP_WORDS_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+
+# Capitalized words that are sentence starters, not topics.
+_COMMON_CAP_WORDS = frozenset(
+    {"The", "This", "That", "What", "When", "Where", "How", "Why"}
+)
+
+
+@dataclass(slots=True)
 class TranscriptSegment:
-    """A segment of transcript with timing."""
+    """A segment of transcript with timing.
+
+    Long videos produce thousands of these, so slots matters: no
+    per-instance __dict__ and faster attribute access in the
+    structure-analysis loops.
+    """
     text: str
     start: float
     duration: float
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoTranscript:
-    """Full video transcript with metadata."""
+    """Full video transcript with metadata.
+
+    starts holds the segment start times as a flat sorted list built
+    once at construction, so time-based lookups (section boundaries,
+    timestamp searches) bisect over it instead of re-walking the
+    segment objects.
+
+    full_text is derived lazily from the segments on first access and
+    cached, so codepaths that only touch segments (timestamp search)
+    never pay for the regex-heavy combine step.
+
+    texts mirrors starts: the text column as a bare list[str], so hot
+    scans walk plain string pointers instead of dereferencing a segment
+    object per iteration.
+    """
     video_id: str
     language: str
     segments: list[TranscriptSegment]
-    full_text: str
     is_auto_generated: bool
+    starts: list[float] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    _full_text: str = ""
+
+    @property
+    def full_text(self) -> str:
+        """Combined clean text, built on first access."""
+        if not self._full_text:
+            if self.texts:
+                self._full_text = _combine_texts(self.texts)
+            else:
+                self._full_text = _combine_segments(self.segments)
+        return self._full_text
+
+
+def _load_cached_transcript(
+    video_id: str, languages: list[str]
+) -> Optional[VideoTranscript]:
+    """Load a cached VideoTranscript if present, fresh and language-compatible."""
+    path = _TRANSCRIPT_CACHE_DIR / f"{video_id}.pkl"
+    try:
+        if time.time() - path.stat().st_mtime >= _TRANSCRIPT_CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["languages"] == list(languages):
+            return cached["transcript"]
+    except (OSError, KeyError, pickle.PickleError, AttributeError):
+        pass
+    return None
+
+
+def _store_cached_transcript(
+    video_id: str, languages: list[str], transcript: VideoTranscript
+) -> None:
+    """Atomically write a fetched transcript to the disk cache."""
+    try:
+        _TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _TRANSCRIPT_CACHE_DIR / f"{video_id}.pkl"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"languages": list(languages), "transcript": transcript},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_path.replace(path)
+    except (OSError, pickle.PickleError):
+        pass  # Cache is best-effort; next call re-fetches
+
+
+def _combine_texts(texts: Iterable[str]) -> str:
+    """Combine raw caption texts into coherent clean text.
+
+    Streams whatever iterable it is given straight into the join — raw
+    API dicts' text values or segment texts alike — so no intermediate
+    list of strings or dataclass detour is needed on the full-text path.
+    """
+    # Join first, then clean the whole text once: bracket artifacts
+    # ([Музыка], [Applause]) never span segments, so one regex pass
+    # over the joined string replaces two regex calls per segment.
+    combined = " ".join(texts)
+    # Manual transcripts usually carry no bracket artifacts at all;
+    # the C-level substring check skips the regex pass entirely then.
+    if "[" in combined:
+        combined = _BRACKETS_RE.sub("", combined)
+    combined = _WS_RE.sub(" ", combined)  # Normalize whitespace
+
+    # Fix spacing around punctuation in one fused pass
+    combined = _PUNCT_FIX_RE.sub(_punct_fix, combined)
+
+    return combined.strip()
+
+
+def _combine_segments(segments: list[TranscriptSegment]) -> str:
+    """Combine transcript segments into coherent text with proper spacing."""
+    if not segments:
+        return ""
+    return _combine_texts(segment.text for segment in segments)
+
+
+def _retry(fn, *args, attempts: int = 3, base: float = 0.25):
+    """Call fn, retrying transient network failures with backoff.
+
+    Only requests-level transport errors are retried; semantic outcomes
+    (TranscriptsDisabled, NoTranscriptFound, ...) pass straight through.
+    Runs in a worker thread, so the blocking sleep is fine.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(*args)
+        except RequestException:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(base * 2**attempt)
+
+
+@lru_cache(maxsize=512)
+def _fetch_raw(
+    video_id: str, languages: tuple[str, ...]
+) -> Optional[VideoTranscript]:
+    """Fetch and parse one transcript synchronously, memoized per video.
+
+    The lru_cache makes repeated analysis of the same hot video free
+    after the first call: no network, no disk. Stable no-transcript
+    outcomes are cached as None; transient failures raise and are thus
+    never memoized.
+
+    Runs blocking youtube_transcript_api I/O — call through
+    asyncio.to_thread from async code.
+    """
+    transcript_list = _retry(YouTubeTranscriptApi.list_transcripts, video_id)
+
+    transcript = None
+    is_auto_generated = False
+    used_language = None
+
+    # Try to find manually created transcript first
+    for lang in languages:
+        try:
+            transcript = transcript_list.find_transcript([lang])
+            is_auto_generated = transcript.is_generated
+            used_language = lang
+            break
+        except NoTranscriptFound:
+            continue
+
+    # If no manual transcript, try auto-generated
+    if transcript is None:
+        try:
+            transcript = transcript_list.find_generated_transcript(
+                list(languages)
+            )
+            is_auto_generated = True
+            used_language = transcript.language_code
+        except NoTranscriptFound:
+            # Last resort: get any available transcript
+            try:
+                available = list(transcript_list)
+                if available:
+                    transcript = available[0]
+                    is_auto_generated = transcript.is_generated
+                    used_language = transcript.language_code
+            except Exception:
+                pass
+
+    if transcript is None:
+        logger.warning("no_transcript_found", video_id=video_id)
+        return None
+
+    # Fetch the actual transcript data
+    transcript_data = _retry(transcript.fetch)
+
+    segments = [
+        TranscriptSegment(
+            text=item["text"],
+            start=item["start"],
+            duration=item["duration"],
+        )
+        for item in transcript_data
+    ]
+
+    # Parallel text/start columns for the hot scan paths
+    texts = [segment.text for segment in segments]
+    starts = [segment.start for segment in segments]
+
+    logger.info(
+        "transcript_extracted",
+        video_id=video_id,
+        language=used_language,
+        segments=len(segments),
+        auto_generated=is_auto_generated,
+    )
+
+    return VideoTranscript(
+        video_id=video_id,
+        language=used_language,
+        segments=segments,
+        is_auto_generated=is_auto_generated,
+        starts=starts,
+        texts=texts,
+    )
+
+
+def _punct_fix(m: re.Match) -> str:
+    """Emit the replacement for one _PUNCT_FIX_RE match.
+
+    The first branch also swallows a capital directly after the
+    punctuation, so the space it needs is inserted here — a second pass
+    would otherwise never see it.
+    """
+    punct = m.group(1)
+    if punct:
+        cap = m.group(2)
+        return punct + " " + cap if cap else punct
+    return m.group(3) + " " + m.group(4)
 
 
 class TranscriptExtractor:
@@ -56,76 +308,19 @@ class TranscriptExtractor:
         """
         languages = languages or self.PREFERRED_LANGUAGES
 
-        try:
-            # Get list of available transcripts
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-
-            transcript = None
-            is_auto_generated = False
-            used_language = None
-
-            # Try to find manually created transcript first
-            for lang in languages:
-                try:
-                    transcript = transcript_list.find_transcript([lang])
-                    is_auto_generated = transcript.is_generated
-                    used_language = lang
-                    break
-                except NoTranscriptFound:
-                    continue
-
-            # If no manual transcript, try auto-generated
-            if transcript is None:
-                try:
-                    transcript = transcript_list.find_generated_transcript(languages)
-                    is_auto_generated = True
-                    used_language = transcript.language_code
-                except NoTranscriptFound:
-                    # Last resort: get any available transcript
-                    try:
-                        available = list(transcript_list)
-                        if available:
-                            transcript = available[0]
-                            is_auto_generated = transcript.is_generated
-                            used_language = transcript.language_code
-                    except Exception:
-                        pass
-
-            if transcript is None:
-                logger.warning("no_transcript_found", video_id=video_id)
-                return None
-
-            # Fetch the actual transcript data
-            transcript_data = transcript.fetch()
-
-            segments = [
-                TranscriptSegment(
-                    text=item["text"],
-                    start=item["start"],
-                    duration=item["duration"],
-                )
-                for item in transcript_data
-            ]
-
-            # Combine into full text
-            full_text = self._combine_segments(segments)
-
-            logger.info(
-                "transcript_extracted",
-                video_id=video_id,
-                language=used_language,
-                segments=len(segments),
-                auto_generated=is_auto_generated,
-            )
+        # Disk cache I/O is blocking too — keep it off the event loop
+        # along with the youtube_transcript_api network calls below
+        cached = await asyncio.to_thread(
+            _load_cached_transcript, video_id, languages
+        )
+        if cached is not None:
+            logger.info("transcript_cache_hit", video_id=video_id)
+            return cached
 
-            return VideoTranscript(
-                video_id=video_id,
-                language=used_language,
-                segments=segments,
-                full_text=full_text,
-                is_auto_generated=is_auto_generated,
+        try:
+            result = await asyncio.to_thread(
+                _fetch_raw, video_id, tuple(languages)
             )
-
         except TranscriptsDisabled:
             logger.warning("transcripts_disabled", video_id=video_id)
             return None
@@ -136,6 +331,52 @@ class TranscriptExtractor:
             logger.error("transcript_error", video_id=video_id, error=str(e))
             return None
 
+        if result is not None:
+            await asyncio.to_thread(
+                _store_cached_transcript, video_id, languages, result
+            )
+        return result
+
+    async def get_transcripts(
+        self,
+        video_ids: list[str],
+        concurrency: int = 16,
+    ) -> dict[str, VideoTranscript]:
+        """Fetch transcripts for many videos concurrently.
+
+        Each fetch is a network wait running in a worker thread, so the
+        fan-out collapses N sequential round trips to roughly
+        N/concurrency. Videos without a transcript are simply absent
+        from the result.
+
+        Args:
+            video_ids: Video IDs to fetch.
+            concurrency: Maximum fetches in flight at once.
+
+        Returns:
+            Mapping of video ID to VideoTranscript for successful fetches.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _bounded(video_id: str) -> Optional[VideoTranscript]:
+            async with sem:
+                return await self.get_transcript(video_id)
+
+        results = await asyncio.gather(
+            *(_bounded(vid) for vid in video_ids),
+            return_exceptions=True,
+        )
+
+        transcripts: dict[str, VideoTranscript] = {}
+        for video_id, result in zip(video_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "transcript_error", video_id=video_id, error=str(result)
+                )
+            elif result is not None:
+                transcripts[video_id] = result
+        return transcripts
+
     def _combine_segments(self, segments: list[TranscriptSegment]) -> str:
         """Combine transcript segments into coherent text.
 
@@ -145,25 +386,7 @@ class TranscriptExtractor:
         Returns:
             Combined text with proper spacing.
         """
-        if not segments:
-            return ""
-
-        texts = []
-        for segment in segments:
-            text = segment.text.strip()
-            # Clean up auto-generated artifacts
-            text = re.sub(r"\[.*?\]", "", text)  # Remove [Music], [Applause], etc.
-            text = re.sub(r"\s+", " ", text)  # Normalize whitespace
-            if text:
-                texts.append(text)
-
-        # Join with spaces, then fix punctuation
-        combined = " ".join(texts)
-        # Fix spacing around punctuation
-        combined = re.sub(r"\s+([.,!?])", r"\1", combined)
-        combined = re.sub(r"([.,!?])([A-ZА-Я])", r"\1 \2", combined)
-
-        return combined.strip()
+        return _combine_segments(segments)
 
     def extract_structure(self, transcript: VideoTranscript) -> dict:
         """Analyze transcript structure to identify sections.
@@ -187,22 +410,19 @@ class TranscriptExtractor:
         intro_end = min(60, total_duration * 0.1)  # First 60s or 10%
         outro_start = max(total_duration - 60, total_duration * 0.9)  # Last 60s or 10%
 
-        intro_segments = []
-        main_segments = []
-        outro_segments = []
-
-        for segment in segments:
-            if segment.start < intro_end:
-                intro_segments.append(segment.text)
-            elif segment.start >= outro_start:
-                outro_segments.append(segment.text)
-            else:
-                main_segments.append(segment.text)
+        # Segments are time-ordered, so the two boundaries are bisect
+        # lookups on the start times and the sections are plain slices
+        # of the flat text column — no per-segment branching and no
+        # attribute dereference per element.
+        starts = transcript.starts or [segment.start for segment in segments]
+        texts = transcript.texts or [segment.text for segment in segments]
+        i1 = bisect_left(starts, intro_end)
+        i2 = bisect_left(starts, outro_start)
 
         structure = {
-            "intro": " ".join(intro_segments).strip(),
-            "main": " ".join(main_segments).strip(),
-            "outro": " ".join(outro_segments).strip(),
+            "intro": " ".join(texts[:i1]).strip(),
+            "main": " ".join(texts[i1:i2]).strip(),
+            "outro": " ".join(texts[i2:]).strip(),
             "total_duration": total_duration,
             "word_count": len(full_text.split()),
         }
@@ -229,22 +449,27 @@ class TranscriptExtractor:
 
         topics = []
 
+        # Stream matches and stop at the budget instead of materializing
+        # every match in the text just to slice the head off.
+
         # Find phrases with numbers (likely stats/facts)
-        number_patterns = re.findall(
-            r"[\w\s]{5,30}(?:\d+[%$]|\$\d+|\d+\s*(?:миллион|тысяч|процент|billion|million|thousand|percent))",
-            text,
-            re.IGNORECASE,
-        )
-        topics.extend(number_patterns[:max_topics])
+        for m in _NUMBER_PHRASE_RE.finditer(text):
+            topics.append(m.group())
+            if len(topics) >= max_topics:
+                break
 
         # Find capitalized terms (likely names/protocols)
-        cap_words = re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", text)
-        # Filter common words
-        common = {"The", "This", "That", "What", "When", "Where", "How", "Why"}
-        cap_words = [w for w in cap_words if w not in common]
-        topics.extend(cap_words[:max_topics - len(topics)])
-
-        return list(set(topics))[:max_topics]
+        if len(topics) < max_topics:
+            for m in _CAP_WORDS_RE.finditer(text):
+                word = m.group()
+                if word not in _COMMON_CAP_WORDS:
+                    topics.append(word)
+                    if len(topics) >= max_topics:
+                        break
+
+        # dict.fromkeys dedups in one pass while keeping the
+        # number-phrases-first priority that set() would scramble
+        return list(dict.fromkeys(topics))[:max_topics]
 
     def get_timestamps_for_topics(
         self,
@@ -262,11 +487,29 @@ class TranscriptExtractor:
         """
         timestamps = {}
 
-        for topic in topics:
-            topic_lower = topic.lower()
-            for segment in transcript.segments:
-                if topic_lower in segment.text.lower():
-                    timestamps[topic] = segment.start
-                    break
+        # One pass over the flat text column with a shrinking topic set:
+        # topics are lowercased exactly once up front, each text is
+        # lowered once, found topics drop out of the search, and the
+        # scan stops as soon as every topic has a timestamp — instead of
+        # one full segment walk per topic. Walking texts/starts instead
+        # of segment objects avoids an attribute dereference per element.
+        remaining = {topic: topic.lower() for topic in topics}
+
+        segments = transcript.segments
+        texts = transcript.texts or [segment.text for segment in segments]
+        starts = transcript.starts or [segment.start for segment in segments]
+
+        for i, raw in enumerate(texts):
+            if not remaining:
+                break
+            text = raw.lower()
+            found = [
+                topic
+                for topic, topic_lower in remaining.items()
+                if topic_lower in text
+            ]
+            for topic in found:
+                timestamps[topic] = starts[i]
+                del remaining[topic]
 
         return timestamps